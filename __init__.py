@@ -7,10 +7,12 @@ and visualizing financial data.
 
 __version__ = "0.1.0"
 
+from utils.helpers import lazy_module_getattr
+
 # Import core components for easy access
 from core.schema import TransactionSchema, CategorySchema
 from core.ingestion import (
-    ingest_csv, ingest_excel, create_manual_transaction
+    ingest_csv, ingest_excel, create_manual_transaction, export_csv
 )
 from core.processing import (
     clean_transaction_data, categorize_transaction,
@@ -19,19 +21,25 @@ from core.processing import (
 )
 from core.aggregation import (
     aggregate_by_type, aggregate_by_category,
-    aggregate_by_producer, aggregate_by_month
+    aggregate_by_producer, aggregate_by_month, aggregate_all
 )
 from core.calculation import (
     calculate_net_cashflow, calculate_cash_allocation,
     calculate_budget_comparison
 )
-from output.excel import (
-    create_excel_workbook, populate_transaction_sheet,
-    populate_category_sheet, populate_summary_sheet,
-    create_charts
-)
-from output.visualisations import create_visualisations
 from utils.defaults import (
     create_default_categories, create_category_rules,
     create_producer_patterns, generate_sample_transactions
-)
\ No newline at end of file
+)
+
+# Output helpers pull in openpyxl and matplotlib, so import them on first access
+_LAZY_IMPORTS = {
+    'create_excel_workbook': 'output.excel',
+    'populate_transaction_sheet': 'output.excel',
+    'populate_category_sheet': 'output.excel',
+    'populate_summary_sheet': 'output.excel',
+    'create_charts': 'output.excel',
+    'create_visualisations': 'output.visualisations',
+}
+
+__getattr__ = lazy_module_getattr(globals(), _LAZY_IMPORTS)
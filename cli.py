@@ -4,24 +4,17 @@ Command-line interface for the Cashflow Tracker
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from core.schema import TransactionSchema
 from core.ingestion import ingest_csv, ingest_excel
 from core.processing import (
     clean_transaction_data, categorize_all_transactions, extract_all_producers
 )
-from core.aggregation import (
-    aggregate_by_type, aggregate_by_category,
-    aggregate_by_producer, aggregate_by_month
-)
+from core.aggregation import aggregate_all
 from core.calculation import (
     calculate_net_cashflow, calculate_cash_allocation, calculate_budget_comparison
 )
-from output.excel import (
-    create_excel_workbook, populate_transaction_sheet,
-    populate_category_sheet, populate_summary_sheet, create_charts
-)
-from output.visualisations import create_visualisations
 from utils.defaults import (
     create_default_categories, create_category_rules,
     create_producer_patterns, generate_sample_transactions
@@ -44,9 +37,21 @@ def main():
                         help='Generate additional matplotlib charts')
     parser.add_argument('--charts-dir', default='charts',
                         help='Directory to save additional charts')
+    parser.add_argument('--chart-dpi', type=int,
+                        help='Resolution of the saved chart images (use 300 for print)')
+    parser.add_argument('--chart-formats', nargs='+', default=['png'],
+                        help='File formats to save each chart in, e.g. png svg')
+    parser.add_argument('--reuse-charts', action='store_true',
+                        help='Keep existing chart images when the data has not changed')
 
     args = parser.parse_args()
 
+    # Output modules are slow to import, so load them only once there is work to do
+    from output.excel import (
+        create_excel_workbook, populate_transaction_sheet,
+        populate_category_sheet, populate_summary_sheet, create_charts
+    )
+
     # Step 1: Data ingestion
     if args.sample:
         print("Generating sample data...")
@@ -82,10 +87,11 @@ def main():
 
     # Step 5: Aggregate data
     print("Aggregating data...")
-    type_summary = aggregate_by_type(transaction_data)
-    category_summary = aggregate_by_category(transaction_data)
-    producer_summary = aggregate_by_producer(transaction_data)
-    monthly_summary = aggregate_by_month(transaction_data)
+    summaries = aggregate_all(transaction_data)
+    type_summary = summaries['type']
+    category_summary = summaries['category']
+    producer_summary = summaries['producer']
+    monthly_summary = summaries['month']
 
     # Step 6: Calculations
     print("Performing calculations...")
@@ -104,16 +110,24 @@ def main():
     populate_summary_sheet(wb, type_summary, category_summary, cash_allocation, budget_comparison)
     create_charts(wb, category_summary, cash_allocation, monthly_summary)
 
-    # Step 9: Save workbook
+    # Step 9: Save workbook in the background so the write overlaps chart rendering
     print(f"Saving workbook to {args.output}...")
-    wb.save(args.output)
-
-    # Step 10: Generate additional charts if requested
-    if args.charts:
-        print(f"Generating additional charts in '{args.charts_dir}'...")
-        if not os.path.exists(args.charts_dir):
-            os.makedirs(args.charts_dir)
-        create_visualisations(transaction_data, args.charts_dir)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        save_future = executor.submit(wb.save, args.output)
+
+        try:
+            # Step 10: Generate additional charts if requested
+            if args.charts:
+                from output.visualisations import create_visualisations
+                from output.visualisations.charts.constants import DEFAULT_DPI
+
+                print(f"Generating additional charts in '{args.charts_dir}'...")
+                os.makedirs(args.charts_dir, exist_ok=True)
+                create_visualisations(transaction_data, args.charts_dir, dpi=args.chart_dpi or DEFAULT_DPI,
+                                      reuse_unchanged=args.reuse_charts, formats=args.chart_formats)
+        finally:
+            # Surface any error raised while saving, even if charting failed
+            save_future.result()
 
     print("Done!")
     return 0
\ No newline at end of file
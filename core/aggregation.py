@@ -2,8 +2,9 @@
 Data aggregation functions for the Cashflow Tracker
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, Optional
 from core.schema import TransactionSchema
 
 
@@ -17,11 +18,13 @@ def aggregate_by_type(df: pd.DataFrame) -> Dict[str, float]:
     Returns:
         Dict with total income and expense
     """
-    result = df.groupby(TransactionSchema.TYPE)[TransactionSchema.AMOUNT].sum()
+    # Two totals only need a masked sum each, not a full groupby
+    types = df[TransactionSchema.TYPE]
+    amounts = df[TransactionSchema.AMOUNT].to_numpy(dtype=float)
 
     return {
-        'Income': result.get('Income', 0),
-        'Expense': result.get('Expense', 0)
+        label: np.nansum(amounts[types.eq(label).to_numpy(dtype=bool, na_value=False)])
+        for label in ('Income', 'Expense')
     }
 
 
@@ -35,7 +38,7 @@ def aggregate_by_category(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with amount sum per category
     """
-    return df.groupby([TransactionSchema.TYPE, TransactionSchema.CATEGORY])[
+    return df.groupby([TransactionSchema.TYPE, TransactionSchema.CATEGORY], observed=True)[
         TransactionSchema.AMOUNT].sum().reset_index()
 
 
@@ -49,7 +52,7 @@ def aggregate_by_producer(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with amount sum per producer
     """
-    return df.groupby([TransactionSchema.TYPE, TransactionSchema.PRODUCER])[
+    return df.groupby([TransactionSchema.TYPE, TransactionSchema.PRODUCER], observed=True)[
         TransactionSchema.AMOUNT].sum().reset_index()
 
 
@@ -63,14 +66,15 @@ def aggregate_by_month(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with amount sum per month and type
     """
-    # Add month column
-    df_with_month = df.copy()
-    df_with_month['Month'] = df_with_month[TransactionSchema.DATE].dt.strftime('%Y-%m')
-
-    # Group by month and type
-    return df_with_month.groupby(['Month', TransactionSchema.TYPE])[
+    # Group by month period and type without copying the frame
+    month = df[TransactionSchema.DATE].dt.to_period('M').rename('Month')
+    result = df.groupby([month, df[TransactionSchema.TYPE]], observed=True)[
         TransactionSchema.AMOUNT].sum().reset_index()
 
+    # Format month labels on the aggregated rows only
+    result['Month'] = result['Month'].astype(str)
+    return result
+
 
 def aggregate_by_payment_method(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -82,7 +86,7 @@ def aggregate_by_payment_method(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with amount sum per payment method
     """
-    return df.groupby([TransactionSchema.TYPE, TransactionSchema.PAYMENT_METHOD])[
+    return df.groupby([TransactionSchema.TYPE, TransactionSchema.PAYMENT_METHOD], observed=True)[
         TransactionSchema.AMOUNT].sum().reset_index()
 
 
@@ -97,5 +101,45 @@ def aggregate_by_subcategory(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with amount sum per subcategory within category
     """
     return df.groupby([TransactionSchema.TYPE, TransactionSchema.CATEGORY,
-                       TransactionSchema.SUBCATEGORY])[
+                       TransactionSchema.SUBCATEGORY], observed=True)[
         TransactionSchema.AMOUNT].sum().reset_index()
+
+
+def aggregate_all(df: pd.DataFrame, engine: Optional[str] = None) -> Dict[str, object]:
+    """
+    Aggregate transactions by type, category, producer and month in one pass
+
+    Args:
+        df: DataFrame with transaction data
+        engine: Engine for the full-frame sum ('cython' or 'numba'); 'numba'
+            requires numba and pays a one-off compile cost, so it only helps
+            on very large frames
+
+    Returns:
+        Dict with 'type', 'category', 'producer' and 'month' summaries, matching
+        aggregate_by_type, aggregate_by_category, aggregate_by_producer and
+        aggregate_by_month
+    """
+    # One pass over the full frame; keep missing keys so each summary can drop its own
+    month = df[TransactionSchema.DATE].dt.to_period('M').rename('Month')
+    totals = df.groupby([df[TransactionSchema.TYPE], df[TransactionSchema.CATEGORY],
+                         df[TransactionSchema.PRODUCER], month],
+                        observed=True, dropna=False)[TransactionSchema.AMOUNT].sum(engine=engine)
+
+    # Derive each summary from the small aggregated table
+    def summarize(*levels: str) -> pd.DataFrame:
+        return totals.groupby(level=list(levels), observed=True).sum().reset_index()
+
+    by_type = totals.groupby(level=TransactionSchema.TYPE, observed=True).sum()
+    monthly = summarize('Month', TransactionSchema.TYPE)
+    monthly['Month'] = monthly['Month'].astype(str)
+
+    return {
+        'type': {
+            'Income': by_type.get('Income', 0),
+            'Expense': by_type.get('Expense', 0)
+        },
+        'category': summarize(TransactionSchema.TYPE, TransactionSchema.CATEGORY),
+        'producer': summarize(TransactionSchema.TYPE, TransactionSchema.PRODUCER),
+        'month': monthly
+    }
@@ -2,8 +2,9 @@
 Financial calculation functions for the Cashflow Tracker
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict
 from core.schema import TransactionSchema, CategorySchema
 
 
@@ -33,24 +34,19 @@ def calculate_cash_allocation(df: pd.DataFrame) -> Dict[str, float]:
     """
     # Filter for expenses only
     expenses = df[df[TransactionSchema.TYPE] == 'Expense']
-    total_expenses = expenses[TransactionSchema.AMOUNT].sum()
 
-    # Calculate allocations
-    spending = expenses[~expenses[TransactionSchema.CATEGORY].isin(
-        ['Savings', 'Investments'])][TransactionSchema.AMOUNT].sum()
-
-    saving = expenses[expenses[TransactionSchema.CATEGORY] == 'Savings'][
-        TransactionSchema.AMOUNT].sum()
-
-    investing = expenses[expenses[TransactionSchema.CATEGORY] == 'Investments'][
-        TransactionSchema.AMOUNT].sum()
+    # Bucket each expense once and sum all allocations in a single groupby
+    category = expenses[TransactionSchema.CATEGORY].to_numpy()
+    bucket = np.where(category == 'Savings', 'Saving',
+                      np.where(category == 'Investments', 'Investing', 'Spending'))
+    totals = expenses[TransactionSchema.AMOUNT].groupby(bucket).sum()
+    total_expenses = totals.sum()
 
     # Calculate percentages
     if total_expenses > 0:
         return {
-            'Spending': spending / total_expenses * 100,
-            'Saving': saving / total_expenses * 100,
-            'Investing': investing / total_expenses * 100
+            label: totals.get(label, 0) / total_expenses * 100
+            for label in ('Spending', 'Saving', 'Investing')
         }
     else:
         return {'Spending': 0, 'Saving': 0, 'Investing': 0}
@@ -102,19 +98,19 @@ def calculate_monthly_growth_rate(df: pd.DataFrame,
     Returns:
         Dict with growth rates for income and expenses
     """
-    # Add month column and sort
-    df_with_month = df.copy()
-    df_with_month['Month'] = pd.to_datetime(df_with_month[TransactionSchema.DATE]).dt.strftime('%Y-%m')
-    monthly_data = df_with_month.groupby(['Month', TransactionSchema.TYPE])[
-        TransactionSchema.AMOUNT].sum().reset_index()
-
-    # Convert to pivot table
-    pivot = monthly_data.pivot(index='Month', columns=TransactionSchema.TYPE,
-                               values=TransactionSchema.AMOUNT).fillna(0)
-    pivot = pivot.sort_index()
-
-    # Limit to requested number of months
-    pivot = pivot.tail(months)
+    # Group by calendar month without copying the frame or formatting date strings
+    dates = df[TransactionSchema.DATE]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
+    month = dates.dt.to_period('M')
+    recent_months = pd.Index(month.dropna().unique()).sort_values()[-months:] if months > 0 else []
+
+    # Only the requested months are needed, so drop older history before grouping
+    recent = month.isin(recent_months).to_numpy()
+    pivot = (df.loc[recent, TransactionSchema.AMOUNT]
+             .groupby([month[recent], df.loc[recent, TransactionSchema.TYPE]], observed=True)
+             .sum()
+             .unstack(fill_value=0))
 
     # Calculate growth rates
     growth_rates = {}
@@ -150,4 +146,24 @@ def calculate_savings_rate(income: float, expenses: float) -> float:
         savings = income - expenses
         return (savings / income) * 100
     else:
-        return 0
\ No newline at end of file
+        return 0
+
+
+def calculate_savings_rate_bulk(income: np.ndarray, expenses: np.ndarray) -> np.ndarray:
+    """
+    Calculate savings rates for many (income, expenses) pairs at once
+
+    Args:
+        income: Array of total income values
+        expenses: Array of total expenses excluding savings/investments
+
+    Returns:
+        Array of savings rates as percentages (0 where income is not positive)
+    """
+    income = np.asarray(income, dtype=float)
+    expenses = np.asarray(expenses, dtype=float)
+
+    # Divide only where income is positive so no warnings are raised for the rest
+    rates = np.zeros(np.broadcast(income, expenses).shape)
+    np.divide(income - expenses, income, out=rates, where=income > 0)
+    return rates * 100
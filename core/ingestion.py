@@ -2,24 +2,90 @@
 Data ingestion functions for the Cashflow Tracker
 """
 
+import importlib.util
+import numpy as np
 import pandas as pd
-from typing import Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
 from core.schema import TransactionSchema
 
+# PyArrow is optional; when installed it provides a multithreaded CSV parser
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
 
-def ingest_csv(file_path: str) -> pd.DataFrame:
+
+def ingest_csv(file_path: str, use_arrow: bool = True) -> pd.DataFrame:
     """
     Ingest data from CSV file
 
     Args:
         file_path: Path to the CSV file
+        use_arrow: Parse with the PyArrow engine when it is installed
 
     Returns:
         DataFrame with the raw data
     """
+    if use_arrow and HAS_PYARROW:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.types as pa_types
+
+        # PyArrow infers dates and timestamps in any column; keep those as raw text like
+        # the default parser. The schema is inferred from the first block only
+        try:
+            with pa_csv.open_csv(file_path) as reader:
+                temporal = [field.name for field in reader.schema if pa_types.is_temporal(field.type)]
+        except pa.ArrowInvalid:
+            # Leave unreadable files to read_csv so it raises its usual ParserError
+            temporal = []
+        return pd.read_csv(file_path, engine='pyarrow', dtype=dict.fromkeys(temporal, str))
+
     return pd.read_csv(file_path)
 
 
+def export_csv(df: pd.DataFrame, file_path: str, use_arrow: bool = True) -> None:
+    """
+    Export transactions to a CSV file
+
+    Args:
+        df: DataFrame to write
+        file_path: Path to the output CSV file
+        use_arrow: Write with the PyArrow CSV writer when it is installed
+    """
+    if use_arrow and HAS_PYARROW:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), file_path)
+        return
+
+    df.to_csv(file_path, index=False)
+
+
+def _dedup_header(names: List[Any]) -> List[Any]:
+    """
+    Rename repeated column names the way read_excel does
+
+    Args:
+        names: Column names from the header row
+
+    Returns:
+        Names with later duplicates suffixed, e.g. Amount, Amount.1, Amount.2,
+        skipping suffixed names that already appear in the header
+    """
+    counts = defaultdict(int)
+    unique = list(names)
+    for i, original in enumerate(names):
+        name = original
+        count = counts[name]
+        while count > 0:
+            counts[original] = count + 1
+            name = f'{original}.{count}'
+            count = count + 1 if name in unique else counts[name]
+        unique[i] = name
+        counts[name] = count + 1
+    return unique
+
+
 def ingest_excel(file_path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
     """
     Ingest data from Excel file
@@ -31,16 +97,44 @@ def ingest_excel(file_path: str, sheet_name: Optional[str] = None) -> pd.DataFra
     Returns:
         DataFrame with the raw data
     """
-    if sheet_name:
-        return pd.read_excel(file_path, sheet_name=sheet_name)
-    else:
-        return pd.read_excel(file_path)
+    # openpyxl only reads the xlsx family; leave legacy formats to pandas
+    if not str(file_path).lower().endswith(('.xlsx', '.xlsm')):
+        if sheet_name:
+            return pd.read_excel(file_path, sheet_name=sheet_name)
+        else:
+            return pd.read_excel(file_path)
+
+    from openpyxl import load_workbook
+
+    # Stream plain cell values instead of building the full workbook in memory
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = _dedup_header([f'Unnamed: {i}' if name is None else name
+                                for i, name in enumerate(next(rows, ()))])
+        data = list(rows)
+    finally:
+        wb.close()
+
+    # Like read_excel, keep blank rows inside the table but drop the trailing ones
+    while data and all(value is None for value in data[-1]):
+        data.pop()
+
+    df = pd.DataFrame(data, columns=header)
+
+    # Like read_excel, columns without any values are float NaN rather than None
+    if len(df):
+        for i in np.flatnonzero(df.isna().all().to_numpy()):
+            df.isetitem(i, df.iloc[:, i].astype(float))
+
+    return df
 
 
 def create_manual_transaction(date: str, description: str, amount: float,
                               transaction_type: str, category: Optional[str] = None,
                               subcategory: Optional[str] = None, producer: Optional[str] = None,
-                              payment_method: Optional[str] = None, notes: Optional[str] = None) -> pd.Series:
+                              payment_method: Optional[str] = None, notes: Optional[str] = None) -> Dict[str, Any]:
     """
     Create a new transaction manually
 
@@ -52,10 +146,10 @@ def create_manual_transaction(date: str, description: str, amount: float,
         category, subcategory, producer, payment_method, notes: Optional fields
 
     Returns:
-        Series containing the transaction data
+        Dict keyed by schema column, ready to pass to pd.DataFrame
     """
-    return pd.Series({
-        TransactionSchema.DATE: pd.to_datetime(date),
+    return {
+        TransactionSchema.DATE: pd.Timestamp(date),
         TransactionSchema.DESCRIPTION: description,
         TransactionSchema.AMOUNT: float(amount),
         TransactionSchema.TYPE: transaction_type,
@@ -64,4 +158,4 @@ def create_manual_transaction(date: str, description: str, amount: float,
         TransactionSchema.PRODUCER: producer,
         TransactionSchema.PAYMENT_METHOD: payment_method,
         TransactionSchema.NOTES: notes
-    })
+    }
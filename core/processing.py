@@ -2,14 +2,84 @@
 Data processing functions for the Cashflow Tracker
 """
 
+import numpy as np
 import pandas as pd
 import re
-from typing import Dict, List, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from core.schema import TransactionSchema
 
 
+# Largest magnitude for which float32 still round-trips two decimal places
+_FLOAT32_MAX_EXACT_CENTS = 2 ** 17
+
+# Common statement date layouts, tried in order against the first date
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y')
+
+
+def _detect_date_format(dates: pd.Series) -> Optional[str]:
+    """Guess the format of a date column from its first value, or None to let pandas infer it"""
+    present = dates.notna().to_numpy()
+    if not present.any() or not isinstance(dates.iloc[present.argmax()], str):
+        return None
+
+    sample = dates.iloc[present.argmax()].strip()
+    for date_format in _DATE_FORMATS:
+        try:
+            datetime.strptime(sample, date_format)
+            return date_format
+        except ValueError:
+            continue
+
+    try:
+        datetime.fromisoformat(sample)
+        return 'ISO8601'
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _keyword_regex(keywords: Tuple[str, ...]) -> 're.Pattern':
+    """Compile a case-insensitive substring matcher for a category's keywords"""
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords), re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _producer_regex(pattern: str) -> 're.Pattern':
+    """Compile a single producer pattern"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _combined_producer_regex(patterns: Tuple[str, ...]) -> Optional['re.Pattern']:
+    """
+    Combine producer patterns into one regex with a named group per pattern
+
+    Each alternative is a lookahead anchored at the start of the description,
+    so the first pattern in order wins, as with sequential re.search calls.
+    The lookahead skips ahead with [\\s\\S]*? rather than DOTALL so that '.' in
+    the patterns still stops at newlines.
+
+    Returns:
+        Compiled regex, or None when a pattern has its own groups or inline
+        flags, which would change meaning or fail once combined
+    """
+    if any(_producer_regex(pattern).groups for pattern in patterns):
+        return None
+
+    try:
+        return re.compile('^(?:' + '|'.join(f'(?=[\\s\\S]*?(?P<p{i}>{pattern}))'
+                                            for i, pattern in enumerate(patterns)) + ')',
+                          re.IGNORECASE)
+    except re.error:
+        return None
+
+
 def clean_transaction_data(df: pd.DataFrame, date_col: Optional[str] = None,
-                           amount_col: Optional[str] = None) -> pd.DataFrame:
+                           amount_col: Optional[str] = None,
+                           date_format: Optional[str] = None,
+                           precision: str = 'float64') -> pd.DataFrame:
     """
     Clean and normalize transaction data
 
@@ -17,86 +87,93 @@ def clean_transaction_data(df: pd.DataFrame, date_col: Optional[str] = None,
         df: DataFrame with raw transaction data
         date_col: Column name containing date (if not standard)
         amount_col: Column name containing amount (if not standard)
+        date_format: strftime format of the dates (detected from the data if not given)
+        precision: Float dtype for amounts, 'float64' or 'float32'; float32 halves
+            the memory scanned by aggregations but only keeps cents exact below 131,072
 
     Returns:
-        Cleaned DataFrame with standardized structure
+        Cleaned DataFrame with standardized structure; Type, Category, Subcategory,
+        Payment Method and Producer are categoricals, so new labels must be added to
+        their categories (or the column converted back to str) before assigning them
     """
-    # Create a copy to avoid modifying the original
-    clean_df = df.copy()
+    # Build a new frame with the schema columns, adding any that are missing
+    clean_df = df.reindex(columns=TransactionSchema.get_columns())
 
     # Map columns to standard schema if needed
     if date_col and date_col != TransactionSchema.DATE:
-        clean_df[TransactionSchema.DATE] = clean_df[date_col]
+        clean_df[TransactionSchema.DATE] = df[date_col]
 
     if amount_col and amount_col != TransactionSchema.AMOUNT:
-        clean_df[TransactionSchema.AMOUNT] = clean_df[amount_col]
+        clean_df[TransactionSchema.AMOUNT] = df[amount_col]
 
-    # Ensure date is datetime
-    if TransactionSchema.DATE in clean_df.columns:
-        clean_df[TransactionSchema.DATE] = pd.to_datetime(clean_df[TransactionSchema.DATE])
+    # Ensure date is datetime, parsing with an explicit format where possible
+    dates = clean_df[TransactionSchema.DATE]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        date_format = date_format or _detect_date_format(dates)
+        clean_df[TransactionSchema.DATE] = pd.to_datetime(dates, format=date_format, cache=True)
 
     # Ensure amount is float
-    if TransactionSchema.AMOUNT in clean_df.columns:
-        clean_df[TransactionSchema.AMOUNT] = clean_df[TransactionSchema.AMOUNT].astype(float)
-
-    # Add missing columns from the schema
-    for col in TransactionSchema.get_columns():
-        if col not in clean_df.columns:
-            clean_df[col] = None
+    clean_df[TransactionSchema.AMOUNT] = clean_df[TransactionSchema.AMOUNT].astype(float)
 
     # Determine transaction type based on amount if not specified
     if TransactionSchema.TYPE not in df.columns or df[TransactionSchema.TYPE].isna().any():
-        mask = clean_df[TransactionSchema.AMOUNT] >= 0
-        clean_df.loc[mask, TransactionSchema.TYPE] = 'Income'
-        clean_df.loc[~mask, TransactionSchema.TYPE] = 'Expense'
+        amounts = clean_df[TransactionSchema.AMOUNT].to_numpy()
+        clean_df[TransactionSchema.TYPE] = np.where(amounts >= 0, 'Income', 'Expense')
 
         # Ensure expense amounts are positive for better readability
-        expense_mask = clean_df[TransactionSchema.TYPE] == 'Expense'
-        clean_df.loc[expense_mask, TransactionSchema.AMOUNT] = clean_df.loc[
-            expense_mask, TransactionSchema.AMOUNT].abs()
+        clean_df[TransactionSchema.AMOUNT] = np.abs(amounts)
+
+    if precision not in ('float64', 'float32'):
+        raise ValueError(f"Unsupported amount precision: {precision}")
+
+    if precision == 'float32':
+        if clean_df[TransactionSchema.AMOUNT].abs().max() >= _FLOAT32_MAX_EXACT_CENTS:
+            raise ValueError("Amounts are too large to store as float32 without losing cents")
+        clean_df[TransactionSchema.AMOUNT] = clean_df[TransactionSchema.AMOUNT].astype('float32')
 
-    return clean_df[TransactionSchema.get_columns()]
+    # Store low-cardinality text columns as categoricals so grouping works on integer codes
+    types = clean_df[TransactionSchema.TYPE]
+    type_categories = pd.Index(['Expense', 'Income']).union(types.dropna().unique())
+    clean_df[TransactionSchema.TYPE] = types.astype(pd.CategoricalDtype(type_categories))
 
+    for column in (TransactionSchema.CATEGORY, TransactionSchema.SUBCATEGORY,
+                   TransactionSchema.PAYMENT_METHOD, TransactionSchema.PRODUCER):
+        clean_df[column] = clean_df[column].astype('category')
 
-def categorize_transaction(transaction: pd.Series,
+    return clean_df
+
+
+def categorize_transaction(description: str,
+                           transaction_type: str,
+                           producer: Optional[str],
                            category_rules: Dict[str, List[str]],
-                           producer_category_map: Optional[Dict[str, str]] = None) -> pd.Series:
+                           producer_category_map: Optional[Dict[str, str]] = None) -> str:
     """
-    Categorize a transaction based on rules and maps
+    Categorize a single transaction based on rules and maps
 
     Args:
-        transaction: Series containing transaction data
+        description: Transaction description
+        transaction_type: 'Income' or 'Expense'
+        producer: Producer/vendor of the transaction (optional)
         category_rules: Dict mapping keywords to categories
         producer_category_map: Dict mapping producers to categories
 
     Returns:
-        Transaction with category assigned
+        Category name for the transaction
     """
-    new_transaction = transaction.copy()
-
     # First check if producer is in the map
-    if (producer_category_map and
-            transaction[TransactionSchema.PRODUCER] in producer_category_map):
-        new_transaction[TransactionSchema.CATEGORY] = producer_category_map[
-            transaction[TransactionSchema.PRODUCER]]
-        return new_transaction
+    if producer_category_map and producer in producer_category_map:
+        return producer_category_map[producer]
 
     # Check description against rules
-    description = str(transaction[TransactionSchema.DESCRIPTION]).lower()
+    description = str(description)
 
     for category, keywords in category_rules.items():
-        for keyword in keywords:
-            if keyword.lower() in description:
-                new_transaction[TransactionSchema.CATEGORY] = category
-                return new_transaction
+        if keywords and _keyword_regex(tuple(keywords)).search(description):
+            return category
 
     # Default category based on type
-    if transaction[TransactionSchema.TYPE] == 'Income':
-        new_transaction[TransactionSchema.CATEGORY] = 'Income'
-    else:
-        new_transaction[TransactionSchema.CATEGORY] = 'Miscellaneous'
-
-    return new_transaction
+    return 'Income' if transaction_type == 'Income' else 'Miscellaneous'
 
 
 def categorize_all_transactions(df: pd.DataFrame,
@@ -113,10 +190,36 @@ def categorize_all_transactions(df: pd.DataFrame,
     Returns:
         DataFrame with categories assigned
     """
-    return df.apply(
-        lambda row: categorize_transaction(row, category_rules, producer_category_map),
-        axis=1
-    )
+    # Default category based on type, overwritten by the first matching rule
+    categories = np.where(df[TransactionSchema.TYPE].eq('Income').to_numpy(dtype=bool, na_value=False),
+                          'Income', 'Miscellaneous').astype(object)
+    unassigned = np.ones(len(df), dtype=bool)
+
+    # Producer map takes precedence over keyword rules
+    if producer_category_map:
+        producers = df[TransactionSchema.PRODUCER]
+        mapped = producers.isin(list(producer_category_map)).to_numpy(dtype=bool)
+        categories[mapped] = producers[mapped].map(producer_category_map).to_numpy(dtype=object)
+        unassigned &= ~mapped
+
+    # Scan descriptions once per category, only over rows still unassigned
+    descriptions = df[TransactionSchema.DESCRIPTION].map(str).to_numpy(dtype=object)
+
+    for category, keywords in category_rules.items():
+        if not keywords or not unassigned.any():
+            continue
+
+        candidates = np.flatnonzero(unassigned)
+        matched = pd.Series(descriptions[candidates], dtype=object).str.contains(
+            _keyword_regex(tuple(keywords)), regex=True).to_numpy(dtype=bool)
+
+        categories[candidates[matched]] = category
+        unassigned[candidates[matched]] = False
+
+    # Keep categories as a categorical so downstream grouping works on integer codes
+    result = df.copy()
+    result[TransactionSchema.CATEGORY] = pd.Categorical(categories)
+    return result
 
 
 def extract_producer(transaction: pd.Series,
@@ -142,7 +245,7 @@ def extract_producer(transaction: pd.Series,
     # Apply regex patterns if provided
     if producer_patterns:
         for pattern, producer in producer_patterns.items():
-            if re.search(pattern, description, re.IGNORECASE):
+            if _producer_regex(pattern).search(description):
                 new_transaction[TransactionSchema.PRODUCER] = producer
                 return new_transaction
 
@@ -166,7 +269,44 @@ def extract_all_producers(df: pd.DataFrame,
     Returns:
         DataFrame with producers assigned
     """
-    return df.apply(
-        lambda row: extract_producer(row, producer_patterns),
-        axis=1
-    )
+    producers = df[TransactionSchema.PRODUCER].to_numpy(dtype=object, copy=True)
+
+    # Skip rows where producer is already assigned
+    missing = np.flatnonzero(pd.isna(producers))
+
+    # Statements repeat the same descriptions often, so only scan each distinct one
+    codes, uniques = pd.factorize(df[TransactionSchema.DESCRIPTION].iloc[missing].map(str))
+    descriptions = pd.Series(uniques, dtype=object)
+
+    # Default: use first part of description as producer
+    extracted = descriptions.str.split().str[0].to_numpy(dtype=object, copy=True)
+
+    # Apply regex patterns if provided
+    if producer_patterns and len(descriptions):
+        names = np.array(list(producer_patterns.values()), dtype=object)
+        combined = _combined_producer_regex(tuple(producer_patterns))
+
+        if combined is not None:
+            groups = [f'p{i}' for i in range(len(names))]
+            matches = descriptions.str.extract(combined)[groups]
+            hits = matches.notna().to_numpy()
+            matched = hits.any(axis=1)
+            extracted[matched] = names[hits.argmax(axis=1)[matched]]
+        else:
+            # Try the patterns one at a time, in order, on descriptions not matched yet
+            unmatched = np.arange(len(descriptions))
+            for pattern, producer in producer_patterns.items():
+                search = _producer_regex(pattern).search
+                hit = np.fromiter((search(descriptions.iat[i]) is not None for i in unmatched),
+                                  dtype=bool, count=len(unmatched))
+                extracted[unmatched[hit]] = producer
+                unmatched = unmatched[~hit]
+
+    extracted = extracted[codes]
+    found = pd.notna(extracted)
+    producers[missing[found]] = extracted[found]
+
+    # Keep producers as a categorical, like clean_transaction_data does
+    result = df.copy()
+    result[TransactionSchema.PRODUCER] = pd.Categorical(producers)
+    return result
@@ -3,7 +3,7 @@ Example script showing how to process a bank statement
 """
 
 import sys
-import os
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -66,36 +66,21 @@ def process_bank_statement(bank_file):
     # Read the bank statement
     bank_data = pd.read_csv(bank_file)
 
-    # Transform to standard format
-    transactions = pd.DataFrame(columns=TransactionSchema.get_columns())
-    rows = []
-
-    for _, row in bank_data.iterrows():
-        # Determine transaction type and amount
-        if row['Credit'] and float(row['Credit']) > 0:
-            amount = float(row['Credit'])
-            transaction_type = 'Income'
-        else:
-            amount = float(row['Debit']) if row['Debit'] else 0
-            transaction_type = 'Expense'
-
-        # Create transaction
-        transaction = {
-            TransactionSchema.DATE: pd.to_datetime(row['Date']),
-            TransactionSchema.DESCRIPTION: row['Description'],
-            TransactionSchema.AMOUNT: amount,
-            TransactionSchema.TYPE: transaction_type,
-            # Other fields will be filled by processing functions
-            TransactionSchema.CATEGORY: None,
-            TransactionSchema.SUBCATEGORY: None,
-            TransactionSchema.PRODUCER: None,
-            TransactionSchema.PAYMENT_METHOD: 'Bank Account',
-            TransactionSchema.NOTES: None
-        }
-
-        rows.append(transaction)
-
-    transactions = pd.DataFrame(rows)
+    # Transform to standard format: credits are income, everything else an expense
+    credit = pd.to_numeric(bank_data['Credit'], errors='coerce')
+    debit = pd.to_numeric(bank_data['Debit'], errors='coerce')
+    is_income = credit.gt(0).to_numpy()
+
+    transactions = pd.DataFrame({
+        TransactionSchema.DATE: pd.to_datetime(bank_data['Date']),
+        TransactionSchema.DESCRIPTION: bank_data['Description'],
+        TransactionSchema.AMOUNT: np.where(is_income, credit.fillna(0), debit.fillna(0)),
+        TransactionSchema.TYPE: np.where(is_income, 'Income', 'Expense'),
+        TransactionSchema.PAYMENT_METHOD: 'Bank Account'
+    })
+
+    # Other fields will be filled by processing functions
+    transactions = transactions.reindex(columns=TransactionSchema.get_columns())
 
     # Process transactions
     print("Categorizing transactions...")
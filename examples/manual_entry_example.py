@@ -7,13 +7,12 @@ import sys
 import os
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
 
 # Add parent directory to path to import package
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.schema import TransactionSchema
-from core.ingestion import create_manual_transaction
+from core.ingestion import create_manual_transaction, export_csv
 from cli import main as tracker_main
 
 
@@ -69,57 +68,69 @@ def enter_manual_transaction():
     return transaction
 
 
+def show_transactions(rows):
+    """
+    Print a simplified view of transaction entries
+
+    Args:
+        rows: List of transaction dictionaries
+    """
+    print("\n".join(
+        f"{pd.Timestamp(row[TransactionSchema.DATE]):%Y-%m-%d} | "
+        f"{row[TransactionSchema.DESCRIPTION]:<30} | ${row[TransactionSchema.AMOUNT]:>8.2f} | "
+        f"{row[TransactionSchema.TYPE]:<7} | {row[TransactionSchema.CATEGORY]}"
+        for row in rows
+    ))
+
+
 def main():
     """Main function for manual transaction entry example"""
     print("Cashflow Tracker - Manual Transaction Entry Example")
     print("==================================================")
 
-    # Create a transactions DataFrame
-    transactions = pd.DataFrame(columns=TransactionSchema.get_columns())
-
-    # Add some predefined transactions
-    transactions = pd.concat([transactions, pd.DataFrame([{
-        TransactionSchema.DATE: pd.to_datetime("2025-04-01"),
-        TransactionSchema.DESCRIPTION: "Monthly Salary",
-        TransactionSchema.AMOUNT: 3500.00,
-        TransactionSchema.TYPE: "Income",
-        TransactionSchema.CATEGORY: "Income",
-        TransactionSchema.SUBCATEGORY: "Salary",
-        TransactionSchema.PRODUCER: "Employer Inc.",
-        TransactionSchema.PAYMENT_METHOD: "Direct Deposit",
-        TransactionSchema.NOTES: "Regular monthly salary"
-    }])], ignore_index=True)
-
-    transactions = pd.concat([transactions, pd.DataFrame([{
-        TransactionSchema.DATE: pd.to_datetime("2025-04-03"),
-        TransactionSchema.DESCRIPTION: "Rent Payment",
-        TransactionSchema.AMOUNT: 1200.00,
-        TransactionSchema.TYPE: "Expense",
-        TransactionSchema.CATEGORY: "Housing",
-        TransactionSchema.SUBCATEGORY: "Rent/Mortgage",
-        TransactionSchema.PRODUCER: "Landlord",
-        TransactionSchema.PAYMENT_METHOD: "Bank Transfer",
-        TransactionSchema.NOTES: "Monthly apartment rent"
-    }])], ignore_index=True)
-
-    transactions = pd.concat([transactions, pd.DataFrame([{
-        TransactionSchema.DATE: pd.to_datetime("2025-04-10"),
-        TransactionSchema.DESCRIPTION: "Netflix Subscription",
-        TransactionSchema.AMOUNT: 15.99,
-        TransactionSchema.TYPE: "Expense",
-        TransactionSchema.CATEGORY: "Entertainment",
-        TransactionSchema.SUBCATEGORY: "Subscriptions",
-        TransactionSchema.PRODUCER: "Netflix",
-        TransactionSchema.PAYMENT_METHOD: "Credit Card",
-        TransactionSchema.NOTES: "Monthly streaming service"
-    }])], ignore_index=True)
+    # Collect rows first and build the DataFrame once at the end
+    rows = [
+        {
+            TransactionSchema.DATE: "2025-04-01",
+            TransactionSchema.DESCRIPTION: "Monthly Salary",
+            TransactionSchema.AMOUNT: 3500.00,
+            TransactionSchema.TYPE: "Income",
+            TransactionSchema.CATEGORY: "Income",
+            TransactionSchema.SUBCATEGORY: "Salary",
+            TransactionSchema.PRODUCER: "Employer Inc.",
+            TransactionSchema.PAYMENT_METHOD: "Direct Deposit",
+            TransactionSchema.NOTES: "Regular monthly salary"
+        },
+        {
+            TransactionSchema.DATE: "2025-04-03",
+            TransactionSchema.DESCRIPTION: "Rent Payment",
+            TransactionSchema.AMOUNT: 1200.00,
+            TransactionSchema.TYPE: "Expense",
+            TransactionSchema.CATEGORY: "Housing",
+            TransactionSchema.SUBCATEGORY: "Rent/Mortgage",
+            TransactionSchema.PRODUCER: "Landlord",
+            TransactionSchema.PAYMENT_METHOD: "Bank Transfer",
+            TransactionSchema.NOTES: "Monthly apartment rent"
+        },
+        {
+            TransactionSchema.DATE: "2025-04-10",
+            TransactionSchema.DESCRIPTION: "Netflix Subscription",
+            TransactionSchema.AMOUNT: 15.99,
+            TransactionSchema.TYPE: "Expense",
+            TransactionSchema.CATEGORY: "Entertainment",
+            TransactionSchema.SUBCATEGORY: "Subscriptions",
+            TransactionSchema.PRODUCER: "Netflix",
+            TransactionSchema.PAYMENT_METHOD: "Credit Card",
+            TransactionSchema.NOTES: "Monthly streaming service"
+        }
+    ]
 
     # Interactive mode - Add multiple transactions through user input
+    pending = []
     add_more = True
     while add_more:
         print("\nAdding a new transaction...\n")
-        new_transaction = enter_manual_transaction()
-        transactions = pd.concat([transactions, pd.DataFrame([new_transaction])], ignore_index=True)
+        pending.append(enter_manual_transaction())
 
         # In a real app, we would ask for confirmation
         # add_more = input("\nAdd another transaction? (y/n): ").lower().startswith('y')
@@ -127,25 +138,22 @@ def main():
         # For this example, we'll just add one transaction
         add_more = False
 
+    rows.extend(pending)
+
     print("\nAll transactions:")
     print("------------------")
-    # Format the display of transactions
-    display_df = transactions.copy()
-    display_df[TransactionSchema.DATE] = display_df[TransactionSchema.DATE].dt.strftime('%Y-%m-%d')
+    show_transactions(rows)
 
-    # Print a simplified view
-    for i, row in display_df.iterrows():
-        print(f"{row[TransactionSchema.DATE]} | {row[TransactionSchema.DESCRIPTION]:<30} | "
-              f"${row[TransactionSchema.AMOUNT]:>8.2f} | {row[TransactionSchema.TYPE]:<7} | "
-              f"{row[TransactionSchema.CATEGORY]}")
+    # Build the DataFrame only once the entries are ready to be saved
+    transactions = pd.DataFrame(rows, columns=TransactionSchema.get_columns())
+    transactions[TransactionSchema.DATE] = pd.to_datetime(transactions[TransactionSchema.DATE])
 
     # Save transactions to CSV
     output_dir = 'output'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     csv_file = os.path.join(output_dir, "manual_transactions.csv")
-    transactions.to_csv(csv_file, index=False)
+    export_csv(transactions, csv_file)
     print(f"\nTransactions saved to '{csv_file}'")
 
     # Generate the Excel tracker
@@ -163,8 +171,10 @@ def main():
     print(f"  - {output_dir}/charts/ (visualisations)")
 
     print("\nSummary statistics:")
-    total_income = transactions[transactions[TransactionSchema.TYPE] == 'Income'][TransactionSchema.AMOUNT].sum()
-    total_expenses = transactions[transactions[TransactionSchema.TYPE] == 'Expense'][TransactionSchema.AMOUNT].sum()
+    types = transactions[TransactionSchema.TYPE].to_numpy()
+    amounts = transactions[TransactionSchema.AMOUNT].to_numpy(dtype=float)
+    total_income = amounts[types == 'Income'].sum()
+    total_expenses = amounts[types == 'Expense'].sum()
     net_cashflow = total_income - total_expenses
 
     print(f"Total Income: ${total_income:.2f}")
@@ -4,13 +4,13 @@ Example script showing how to generate and analyze sample data
 """
 
 import sys
-import os
 from pathlib import Path
 
 # Add parent directory to path to import package
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.defaults import generate_sample_transactions
+from core.ingestion import export_csv
 from core.processing import (
     clean_transaction_data, categorize_all_transactions, extract_all_producers
 )
@@ -83,7 +83,7 @@ def main():
 
     # Save the transactions to CSV
     output_file = 'sample_transactions.csv'
-    transactions.to_csv(output_file, index=False)
+    export_csv(transactions, output_file)
     print(f"Saved sample transactions to '{output_file}'")
 
 
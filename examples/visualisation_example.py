@@ -4,7 +4,6 @@ Example script showing advanced visualisations
 
 import sys
 import os
-import pandas as pd
 from pathlib import Path
 
 # Add parent directory to path to import package
@@ -26,8 +25,7 @@ def main():
 
     # Create output directory
     output_dir = 'advanced_charts'
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     # Generate standard charts
     print("Generating standard charts...")
@@ -2,7 +2,6 @@
 """
 Cashflow Tracker - A comprehensive tool for tracking and analyzing personal finances
 """
-import argparse
 import sys
 from cli import main
 
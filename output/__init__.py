@@ -5,13 +5,16 @@ This package contains modules for generating outputs from the Cashflow Tracker,
 including Excel workbooks, charts, and visualisations.
 """
 
-# Import key functions for easier access
-from output.excel import (
-    create_excel_workbook,
-    populate_transaction_sheet,
-    populate_category_sheet,
-    populate_summary_sheet,
-    create_charts
-)
+from utils.helpers import lazy_module_getattr
 
-from output.visualisations import create_visualisations
\ No newline at end of file
+# Key functions for easier access; openpyxl and matplotlib are only imported on first use
+_LAZY_IMPORTS = {
+    'create_excel_workbook': 'output.excel',
+    'populate_transaction_sheet': 'output.excel',
+    'populate_category_sheet': 'output.excel',
+    'populate_summary_sheet': 'output.excel',
+    'create_charts': 'output.excel',
+    'create_visualisations': 'output.visualisations',
+}
+
+__getattr__ = lazy_module_getattr(globals(), _LAZY_IMPORTS)
@@ -3,31 +3,91 @@ Excel output generation functions for the Cashflow Tracker
 """
 
 from openpyxl import Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
+from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.formatting.rule import CellIsRule
 from openpyxl.chart import PieChart, Reference, BarChart
 from openpyxl.chart.label import DataLabelList
-from openpyxl.worksheet.datavalidation import DataValidation
 import pandas as pd
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from core.schema import TransactionSchema, CategorySchema
 
+# Style objects are immutable, so one instance can be shared by every cell
+HEADER_FONT = Font(bold=True)
+HEADER_ALIGNMENT = Alignment(horizontal='center')
+TITLE_FONT = Font(bold=True, size=14)
+GOOD_FILL = PatternFill(fgColor="C6EFCE", fill_type="solid")
+WARNING_FILL = PatternFill(fgColor="FFEB9C", fill_type="solid")
+BAD_FILL = PatternFill(fgColor="FFCCCC", fill_type="solid")
+
+DATE_FORMAT = 'YYYY-MM-DD'
+MONEY_FORMAT = '#,##0.00'
+PERCENT_FORMAT = '0.0%'
+
+_TXN_COLUMNS = TransactionSchema.get_columns()
+_TXN_TYPE_LETTER = get_column_letter(_TXN_COLUMNS.index(TransactionSchema.TYPE) + 1)
+_CAT_COLUMNS = CategorySchema.get_columns()
+
+
+def _styled_cell(ws, value: Any, font: Optional[Font] = None,
+                 alignment: Optional[Alignment] = None,
+                 fill: Optional[PatternFill] = None,
+                 number_format: Optional[str] = None) -> WriteOnlyCell:
+    """
+    Build a styled cell for a write-only worksheet
+
+    Args:
+        ws: Write-only worksheet the cell belongs to
+        value: Cell value
+        font: Font to apply (optional)
+        alignment: Alignment to apply (optional)
+        fill: Fill to apply (optional)
+        number_format: Number format to apply (optional)
+
+    Returns:
+        WriteOnlyCell ready to be appended
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    if fill is not None:
+        cell.fill = fill
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def _header_row(ws, headers) -> list:
+    """
+    Build a bold, centred header row for a write-only worksheet
+
+    Args:
+        ws: Write-only worksheet the cells belong to
+        headers: Header labels
+
+    Returns:
+        List of styled header cells
+    """
+    return [_styled_cell(ws, header, font=HEADER_FONT, alignment=HEADER_ALIGNMENT)
+            for header in headers]
+
 
 def create_excel_workbook() -> Workbook:
     """
     Create an Excel workbook with standard sheets
 
+    The workbook is write-only: rows are streamed to disk as they are
+    appended, so each sheet has to be written top to bottom in one pass.
+
     Returns:
         Openpyxl Workbook
     """
-    wb = Workbook()
+    wb = Workbook(write_only=True)
 
-    # Rename default sheet
-    ws = wb.active
-    ws.title = "Transaction Log"
-
-    # Create additional sheets
+    wb.create_sheet("Transaction Log")
     wb.create_sheet("Categories")
     wb.create_sheet("Summary")
     wb.create_sheet("Charts")
@@ -46,28 +106,19 @@ def populate_transaction_sheet(wb: Workbook,
     """
     ws = wb["Transaction Log"]
 
-    # Convert data to Excel format
-    for r_idx, row in enumerate(dataframe_to_rows(transaction_data, index=False, header=True), 1):
-        for c_idx, value in enumerate(row, 1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
-
-    # Format headers
-    for col in range(1, len(TransactionSchema.get_columns()) + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
-
-    # Format date column
-    for row in range(2, len(transaction_data) + 2):
-        cell = ws.cell(row=row, column=1)
-        if cell.value:
-            cell.number_format = 'YYYY-MM-DD'
-
-    # Format amount column
-    for row in range(2, len(transaction_data) + 2):
-        cell = ws.cell(row=row, column=3)
-        if cell.value:
-            cell.number_format = '#,##0.00'
+    # Column settings have to be in place before the first row is streamed
+    for col in range(1, len(_TXN_COLUMNS) + 1):
+        ws.column_dimensions[get_column_letter(col)].auto_size = True
+
+    ws.append(_header_row(ws, transaction_data.columns))
+
+    # Format dates and amounts as the cells are written
+    for row in map(list, transaction_data.itertuples(index=False, name=None)):
+        if row[0]:
+            row[0] = _styled_cell(ws, row[0], number_format=DATE_FORMAT)
+        if row[2]:
+            row[2] = _styled_cell(ws, row[2], number_format=MONEY_FORMAT)
+        ws.append(row)
 
     # Add conditional formatting for transaction types
     income_rule = CellIsRule(operator='equal', formula=['"Income"'],
@@ -75,17 +126,10 @@ def populate_transaction_sheet(wb: Workbook,
     expense_rule = CellIsRule(operator='equal', formula=['"Expense"'],
                               stopIfTrue=True, fill=PatternFill(bgColor="FFCCCC"))
 
-    type_col = TransactionSchema.get_columns().index(TransactionSchema.TYPE) + 1
     if len(transaction_data) > 0:
-        ws.conditional_formatting.add(f"{chr(64 + type_col)}2:{chr(64 + type_col)}{len(transaction_data) + 1}",
-                                  income_rule)
-        ws.conditional_formatting.add(f"{chr(64 + type_col)}2:{chr(64 + type_col)}{len(transaction_data) + 1}",
-                                  expense_rule)
-
-    # Auto-fit columns
-    for col in range(1, len(TransactionSchema.get_columns()) + 1):
-        column_letter = chr(64 + col)
-        ws.column_dimensions[column_letter].auto_size = True
+        type_range = f"{_TXN_TYPE_LETTER}2:{_TXN_TYPE_LETTER}{len(transaction_data) + 1}"
+        ws.conditional_formatting.add(type_range, income_rule)
+        ws.conditional_formatting.add(type_range, expense_rule)
 
 
 def populate_category_sheet(wb: Workbook,
@@ -99,36 +143,27 @@ def populate_category_sheet(wb: Workbook,
     """
     ws = wb["Categories"]
 
-    # Create a copy of the dataframe to avoid modifying the original
-    excel_data = category_data.copy()
-
-    # Convert lists to comma-separated strings
-    for col in excel_data.columns:
-        if excel_data[col].apply(lambda x: isinstance(x, list)).any():
-            excel_data[col] = excel_data[col].apply(lambda x: ', '.join(map(str, x)) if isinstance(x, list) else x)
+    # Convert lists to comma-separated strings column by column, leaving the input untouched
+    columns = []
+    for col in category_data.columns:
+        values = category_data[col]
+        if values.dtype == object:
+            items = values.to_numpy()
+            if any(type(item) is list for item in items):
+                values = [', '.join(map(str, item)) if type(item) is list else item for item in items]
+        columns.append(values)
 
-    # Write the data (including header)
-    for r_idx, row in enumerate(dataframe_to_rows(excel_data, index=False, header=True), 1):
-        for c_idx, value in enumerate(row, 1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
+    # Auto-fit columns (rough approach since openpyxl doesn't auto-fit natively)
+    for col in range(1, len(_CAT_COLUMNS) + 1):
+        ws.column_dimensions[get_column_letter(col)].width = 20  # Manually set a decent width
 
-    # Format headers
-    for col in range(1, len(CategorySchema.get_columns()) + 1):
-        cell = ws.cell(row=1, column=col)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
+    ws.append(_header_row(ws, category_data.columns))
 
     # Format budget column (assuming column 4 is 'Budget Amount')
-    for row in range(2, len(category_data) + 2):
-        cell = ws.cell(row=row, column=4)
-        if isinstance(cell.value, (int, float)):
-            cell.number_format = '#,##0.00'
-
-    # Auto-fit columns (rough approach since openpyxl doesn't auto-fit natively)
-    for col in range(1, len(CategorySchema.get_columns()) + 1):
-        column_letter = chr(64 + col)
-        ws.column_dimensions[column_letter].width = 20  # Manually set a decent width
-
+    for row in map(list, zip(*columns)):
+        if len(row) > 3 and isinstance(row[3], (int, float)):
+            row[3] = _styled_cell(ws, row[3], number_format=MONEY_FORMAT)
+        ws.append(row)
 
 
 def populate_summary_sheet(wb: Workbook,
@@ -148,100 +183,79 @@ def populate_summary_sheet(wb: Workbook,
     """
     ws = wb["Summary"]
 
-    # 1. Overall Summary Section
-    ws['A1'] = "OVERALL SUMMARY"
-    ws['A1'].font = Font(bold=True, size=14)
+    def title(text: str) -> None:
+        ws.append([_styled_cell(ws, text, font=TITLE_FONT)])
 
-    ws['A3'] = "Total Income:"
-    ws['B3'] = type_summary.get('Income', 0)
-    ws['B3'].number_format = '#,##0.00'
+    # 1. Overall Summary Section
+    title("OVERALL SUMMARY")
+    ws.append([])
 
-    ws['A4'] = "Total Expenses:"
-    ws['B4'] = type_summary.get('Expense', 0)
-    ws['B4'].number_format = '#,##0.00'
+    total_income = type_summary.get('Income', 0)
+    total_expense = type_summary.get('Expense', 0)
+    net_cashflow = total_income - total_expense
 
-    ws['A5'] = "Net Cashflow:"
-    ws['B5'] = type_summary.get('Income', 0) - type_summary.get('Expense', 0)
-    ws['B5'].number_format = '#,##0.00'
+    ws.append(["Total Income:", _styled_cell(ws, total_income, number_format=MONEY_FORMAT)])
+    ws.append(["Total Expenses:", _styled_cell(ws, total_expense, number_format=MONEY_FORMAT)])
 
     # Highlight positive/negative cashflow
-    if (type_summary.get('Income', 0) - type_summary.get('Expense', 0)) >= 0:
-        ws['B5'].fill = PatternFill(fgColor="C6EFCE", fill_type="solid")
-    else:
-        ws['B5'].fill = PatternFill(fgColor="FFCCCC", fill_type="solid")
+    ws.append(["Net Cashflow:", _styled_cell(ws, net_cashflow, number_format=MONEY_FORMAT,
+                                             fill=GOOD_FILL if net_cashflow >= 0 else BAD_FILL)])
+    ws.append([])
 
     # 2. Category Summary Section
-    ws['A7'] = "CATEGORY SUMMARY"
-    ws['A7'].font = Font(bold=True, size=14)
-
-    ws['A9'] = "Category"
-    ws['B9'] = "Amount"
-    ws['C9'] = "% of Total"
+    title("CATEGORY SUMMARY")
+    ws.append([])
+    ws.append(["Category", "Amount", "% of Total"])
 
     expense_categories = category_summary[category_summary[TransactionSchema.TYPE] == 'Expense']
-    total_expense = type_summary.get('Expense', 0)
-
-    for i, row in enumerate(expense_categories.itertuples(), 10):
-        ws[f'A{i}'] = row.Category
-        ws[f'B{i}'] = row.Amount
-        ws[f'B{i}'].number_format = '#,##0.00'
 
+    for category, amount in zip(expense_categories[TransactionSchema.CATEGORY],
+                                expense_categories[TransactionSchema.AMOUNT]):
+        share = None
         if total_expense > 0:
-            ws[f'C{i}'] = row.Amount / total_expense
-            ws[f'C{i}'].number_format = '0.0%'
+            share = _styled_cell(ws, amount / total_expense, number_format=PERCENT_FORMAT)
+        ws.append([category, _styled_cell(ws, amount, number_format=MONEY_FORMAT), share])
 
-    # 3. Cash Allocation Section
-    allocation_start_row = 10 + len(expense_categories) + 2
+    ws.append([])
+    ws.append([])
 
-    ws[f'A{allocation_start_row}'] = "CASH ALLOCATION"
-    ws[f'A{allocation_start_row}'].font = Font(bold=True, size=14)
-
-    ws[f'A{allocation_start_row + 2}'] = "Spending:"
-    ws[f'B{allocation_start_row + 2}'] = cash_allocation.get('Spending', 0) / 100
-    ws[f'B{allocation_start_row + 2}'].number_format = '0.0%'
-
-    ws[f'A{allocation_start_row + 3}'] = "Saving:"
-    ws[f'B{allocation_start_row + 3}'] = cash_allocation.get('Saving', 0) / 100
-    ws[f'B{allocation_start_row + 3}'].number_format = '0.0%'
+    # 3. Cash Allocation Section
+    title("CASH ALLOCATION")
+    ws.append([])
 
-    ws[f'A{allocation_start_row + 4}'] = "Investing:"
-    ws[f'B{allocation_start_row + 4}'] = cash_allocation.get('Investing', 0) / 100
-    ws[f'B{allocation_start_row + 4}'].number_format = '0.0%'
+    for label, key in (("Spending:", 'Spending'), ("Saving:", 'Saving'), ("Investing:", 'Investing')):
+        ws.append([label, _styled_cell(ws, cash_allocation.get(key, 0) / 100, number_format=PERCENT_FORMAT)])
 
     # 4. Budget Comparison (if provided)
     if budget_comparison is not None and not budget_comparison.empty:
-        budget_start_row = allocation_start_row + 6
-
-        ws[f'A{budget_start_row}'] = "BUDGET COMPARISON"
-        ws[f'A{budget_start_row}'].font = Font(bold=True, size=14)
-
-        ws[f'A{budget_start_row + 2}'] = "Category"
-        ws[f'B{budget_start_row + 2}'] = "Actual"
-        ws[f'C{budget_start_row + 2}'] = "Budget"
-        ws[f'D{budget_start_row + 2}'] = "% Used"
-        ws[f'E{budget_start_row + 2}'] = "Difference"
-
-        for i, row in enumerate(budget_comparison.itertuples(), budget_start_row + 3):
-            ws[f'A{i}'] = row.Category
-            ws[f'B{i}'] = row.Amount
-            ws[f'B{i}'].number_format = '#,##0.00'
-
-            ws[f'C{i}'] = getattr(row, CategorySchema.BUDGET)
-            ws[f'C{i}'].number_format = '#,##0.00'
-
-            ws[f'D{i}'] = getattr(row, 'Budget Used (%)') / 100
-            ws[f'D{i}'].number_format = '0.0%'
-
-            ws[f'E{i}'] = getattr(row, 'Difference')
-            ws[f'E{i}'].number_format = '#,##0.00'
-
+        ws.append([])
+        title("BUDGET COMPARISON")
+        ws.append([])
+        ws.append(["Category", "Actual", "Budget", "% Used", "Difference"])
+
+        budget_rows = zip(
+            budget_comparison[TransactionSchema.CATEGORY],
+            budget_comparison[TransactionSchema.AMOUNT],
+            budget_comparison[CategorySchema.BUDGET],
+            budget_comparison['Budget Used (%)'],
+            budget_comparison['Difference']
+        )
+        for category, actual, budget, used, difference in budget_rows:
             # Highlight over/under budget
-            if getattr(row, 'Budget Used (%)') > 100:
-                ws[f'D{i}'].fill = PatternFill(fgColor="FFCCCC", fill_type="solid")  # Red for over budget
-            elif getattr(row, 'Budget Used (%)') > 90:
-                ws[f'D{i}'].fill = PatternFill(fgColor="FFEB9C", fill_type="solid")  # Yellow for near budget
+            if used > 100:
+                fill = BAD_FILL  # Red for over budget
+            elif used > 90:
+                fill = WARNING_FILL  # Yellow for near budget
             else:
-                ws[f'D{i}'].fill = PatternFill(fgColor="C6EFCE", fill_type="solid")  # Green for under budget
+                fill = GOOD_FILL  # Green for under budget
+
+            ws.append([
+                category,
+                _styled_cell(ws, actual, number_format=MONEY_FORMAT),
+                _styled_cell(ws, budget, number_format=MONEY_FORMAT),
+                _styled_cell(ws, used / 100, number_format=PERCENT_FORMAT, fill=fill),
+                _styled_cell(ws, difference, number_format=MONEY_FORMAT)
+            ])
 
 
 def create_charts(wb: Workbook,
@@ -259,20 +273,22 @@ def create_charts(wb: Workbook,
     """
     ws = wb["Charts"]
 
+    # Filter for expense categories only
+    expense_data = category_summary[category_summary[TransactionSchema.TYPE] == 'Expense']
+
+    # The sheet is streamed top to bottom, so lay out every data block up front
+    allocation_row = max(15, len(expense_data) + 2)
+    monthly_row = allocation_row + 15
+
     # 1. Spending by Category Pie Chart
     pie_chart1 = PieChart()
     pie_chart1.title = "Spending by Category"
 
-    # Filter for expense categories only
-    expense_data = category_summary[category_summary[TransactionSchema.TYPE] == 'Expense']
-
     # Write category data to chart sheet for reference
-    ws['A1'] = "Category"
-    ws['B1'] = "Amount"
-
-    for i, row in enumerate(expense_data.itertuples(), 2):
-        ws[f'A{i}'] = row.Category
-        ws[f'B{i}'] = row.Amount
+    ws.append(["Category", "Amount"])
+    for category, amount in zip(expense_data[TransactionSchema.CATEGORY],
+                                expense_data[TransactionSchema.AMOUNT]):
+        ws.append([category, amount])
 
     # Create references for chart data
     labels = Reference(ws, min_col=1, min_row=2, max_row=1 + len(expense_data))
@@ -295,17 +311,17 @@ def create_charts(wb: Workbook,
     pie_chart2.title = "Cash Allocation"
 
     # Write allocation data to chart sheet
-    ws['A15'] = "Allocation"
-    ws['B15'] = "Percentage"
+    for _ in range(allocation_row - 2 - len(expense_data)):
+        ws.append([])
+    ws.append(["Allocation", "Percentage"])
 
     allocation_labels = ["Spending", "Saving", "Investing"]
-    for i, label in enumerate(allocation_labels, 16):
-        ws[f'A{i}'] = label
-        ws[f'B{i}'] = cash_allocation.get(label, 0)
+    for label in allocation_labels:
+        ws.append([label, cash_allocation.get(label, 0)])
 
     # Create references for chart data
-    labels = Reference(ws, min_col=1, min_row=16, max_row=18)
-    data = Reference(ws, min_col=2, min_row=16, max_row=18)
+    labels = Reference(ws, min_col=1, min_row=allocation_row + 1, max_row=allocation_row + 3)
+    data = Reference(ws, min_col=2, min_row=allocation_row + 1, max_row=allocation_row + 3)
 
     # Add data to chart
     pie_chart2.add_data(data)
@@ -317,31 +333,27 @@ def create_charts(wb: Workbook,
     pie_chart2.dataLabels.showPercent = True
 
     # Add chart to worksheet
-    ws.add_chart(pie_chart2, "D15")
+    ws.add_chart(pie_chart2, f"D{allocation_row}")
 
     # 3. Monthly Income vs Expenses Bar Chart (if data is available)
     if not monthly_summary.empty:
-        # Pivot the data for easier plotting
-        monthly_pivot = pd.pivot_table(
-            monthly_summary,
-            index='Month',
-            columns=TransactionSchema.TYPE,
-            values=TransactionSchema.AMOUNT,
-            aggfunc='sum'
-        ).fillna(0)
+        # Month and type pairs are already unique, so reshape without re-aggregating
+        monthly_pivot = monthly_summary.set_index(['Month', TransactionSchema.TYPE])[
+            TransactionSchema.AMOUNT].unstack(fill_value=0)
 
         # Sort by month
         monthly_pivot = monthly_pivot.sort_index()
 
         # Write monthly data to chart sheet
-        ws['A30'] = "Month"
-        ws['B30'] = "Income"
-        ws['C30'] = "Expense"
+        for _ in range(monthly_row - allocation_row - 4):
+            ws.append([])
+        ws.append(["Month", "Income", "Expense"])
 
-        for i, (month, row) in enumerate(monthly_pivot.iterrows(), 31):
-            ws[f'A{i}'] = month
-            ws[f'B{i}'] = row.get('Income', 0)
-            ws[f'C{i}'] = row.get('Expense', 0)
+        no_amounts = pd.Series(0, index=monthly_pivot.index)
+        income = monthly_pivot.get('Income', no_amounts).tolist()
+        expense = monthly_pivot.get('Expense', no_amounts).tolist()
+        for month, income_amount, expense_amount in zip(monthly_pivot.index, income, expense):
+            ws.append([month, income_amount, expense_amount])
 
         # Create bar chart
         bar_chart = BarChart()
@@ -351,13 +363,13 @@ def create_charts(wb: Workbook,
         bar_chart.y_axis.title = "Amount"
 
         # Add data series
-        cats = Reference(ws, min_col=1, min_row=31, max_row=30 + len(monthly_pivot))
-        income_data = Reference(ws, min_col=2, min_row=30, max_row=30 + len(monthly_pivot))
-        expense_data = Reference(ws, min_col=3, min_row=30, max_row=30 + len(monthly_pivot))
+        cats = Reference(ws, min_col=1, min_row=monthly_row + 1, max_row=monthly_row + len(monthly_pivot))
+        income_data = Reference(ws, min_col=2, min_row=monthly_row, max_row=monthly_row + len(monthly_pivot))
+        expense_data = Reference(ws, min_col=3, min_row=monthly_row, max_row=monthly_row + len(monthly_pivot))
 
         bar_chart.add_data(income_data, titles_from_data=True)
         bar_chart.add_data(expense_data, titles_from_data=True)
         bar_chart.set_categories(cats)
 
         # Add to worksheet
-        ws.add_chart(bar_chart, "D30")
\ No newline at end of file
+        ws.add_chart(bar_chart, f"D{monthly_row}")
@@ -2,6 +2,13 @@
 Visualization package for the Cashflow Tracker
 """
 
-from .charts import create_visualisations
+from utils.helpers import lazy_module_getattr
 
-__all__ = ['create_visualisations']
\ No newline at end of file
+# The charts pull in matplotlib and seaborn, so they are only imported on first use
+_LAZY_IMPORTS = {
+    'create_visualisations': 'output.visualisations.charts',
+}
+
+__all__ = ['create_visualisations']
+
+__getattr__ = lazy_module_getattr(globals(), _LAZY_IMPORTS)
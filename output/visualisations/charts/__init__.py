@@ -2,12 +2,16 @@
 Charts module for the Cashflow Tracker
 """
 
-from .manager import (
-    create_visualisations,
-    PROFESSIONAL_COLORS,
-    money_formatter,
-    set_professional_style,
-)
+import sys
+import matplotlib
+
+# Charts are only ever written to files, so use the non-interactive Agg backend and skip
+# GUI backend probing; leave the backend alone if pyplot is already in use by the caller
+if 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Agg')
+
+from .manager import create_visualisations, set_professional_style
+from .constants import PROFESSIONAL_COLORS, money_formatter
 from .category_spending_chart import generate_spending_by_category_chart
 from .monthly_comparison_chart import generate_monthly_comparison_chart
 from .cash_allocation_chart import generate_cash_allocation_chart
@@ -5,16 +5,18 @@ Budget comparison chart generation for the Cashflow Tracker
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-import os
 from matplotlib.ticker import FuncFormatter
 from pandas import DataFrame
+from typing import Optional, Sequence
 
 from core.schema import TransactionSchema
-from .constants import money_formatter
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, TITLE_STYLE, group_totals, money_formatter, save_chart
 
 
 def generate_budget_comparison_chart(expense_data: pd.DataFrame, budget_data: pd.DataFrame,
-                                     output_dir: str = '.') -> DataFrame | None:
+                                     output_dir: str = '.',
+                                     category_totals: Optional[pd.Series] = None,
+                                     dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> DataFrame | None:
     """
     Generate a bar chart comparing actual spending to budget by category
 
@@ -22,6 +24,9 @@ def generate_budget_comparison_chart(expense_data: pd.DataFrame, budget_data: pd
         expense_data: DataFrame with expense data
         budget_data: DataFrame with budget information
         output_dir: Directory to save images
+        category_totals: Precomputed expense totals per category (computed from expense_data if omitted)
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         DataFrame with budget comparison data
@@ -30,20 +35,15 @@ def generate_budget_comparison_chart(expense_data: pd.DataFrame, budget_data: pd
         return None
 
     # Aggregate expenses by category
-    category_totals = expense_data.groupby(TransactionSchema.CATEGORY)[
-        TransactionSchema.AMOUNT].sum().reset_index()
-
-    # Merge with budget data
-    budget_compare = pd.merge(
-        category_totals,
-        budget_data,
-        left_on=TransactionSchema.CATEGORY,
-        right_on='Main Category',
-        how='left'
-    )
+    if category_totals is None:
+        category_totals = group_totals(expense_data, TransactionSchema.CATEGORY)
 
-    # Remove categories with no budget
-    budget_compare = budget_compare.dropna(subset=['Budget Amount'])
+    # Budgets may list several subcategories per main category, so total them first;
+    # then look up each category's budget and remove categories with no budget
+    budget_amounts = budget_data.groupby('Main Category')['Budget Amount'].sum(min_count=1)
+    budget_compare = category_totals.to_frame().assign(**{
+        'Budget Amount': budget_amounts.reindex(category_totals.index).to_numpy()
+    }).dropna(subset=['Budget Amount']).reset_index()
 
     if budget_compare.empty:
         return None
@@ -84,9 +84,9 @@ def generate_budget_comparison_chart(expense_data: pd.DataFrame, budget_data: pd
     )
 
     # Add proper styling
-    ax.set_xlabel('Category', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Amount', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_title('Budget vs. Actual Expenditure Analysis', fontweight='bold', fontsize=14, pad=15)
+    ax.set_xlabel('Category', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Amount', **AXIS_LABEL_STYLE)
+    ax.set_title('Budget vs. Actual Expenditure Analysis', **TITLE_STYLE)
     ax.set_xticks(x_pos)
     ax.set_xticklabels(categories, rotation=45, ha='right')
 
@@ -104,15 +104,17 @@ def generate_budget_comparison_chart(expense_data: pd.DataFrame, budget_data: pd
     # Add subtle grid
     ax.grid(axis='y', linestyle='--', alpha=0.3)
 
-    # Add percentage labels above bars
-    for i, (actual, budget) in enumerate(zip(budget_compare[TransactionSchema.AMOUNT],
-                                             budget_compare['Budget Amount'])):
-        percentage = (actual / budget * 100) if budget > 0 else 0
-        color = '#c44e52' if percentage > 100 else '#55a868'
+    # Add percentage labels above bars, with positions and colors computed for all bars at once
+    actual = budget_compare[TransactionSchema.AMOUNT].to_numpy(dtype=float)
+    budget = budget_compare['Budget Amount'].to_numpy(dtype=float)
+    percentages = np.divide(actual, budget, out=np.zeros_like(actual), where=budget > 0) * 100
+    label_heights = np.maximum(actual, budget) * 1.05
+    label_colors = np.where(percentages > 100, '#c44e52', '#55a868')
 
+    for x, height, percentage, color in zip(x_pos, label_heights, percentages, label_colors):
         ax.text(
-            x_pos[i],
-            max(actual, budget) * 1.05,
+            x,
+            height,
             f'{percentage:.1f}%',
             ha='center',
             va='bottom',
@@ -123,7 +125,6 @@ def generate_budget_comparison_chart(expense_data: pd.DataFrame, budget_data: pd
 
     # Save the figure
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'budget_vs_actual.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'budget_vs_actual.png', dpi, formats)
 
     return budget_compare
\ No newline at end of file
@@ -3,31 +3,34 @@ Cash allocation chart generation for the Cashflow Tracker
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import os
+from typing import Sequence
 from core.schema import TransactionSchema
+from .constants import DEFAULT_DPI, TITLE_STYLE, save_chart
 
 
-def generate_cash_allocation_chart(expense_data: pd.DataFrame, output_dir: str = '.') -> dict:
+def generate_cash_allocation_chart(expense_data: pd.DataFrame, output_dir: str = '.',
+                                   dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> dict:
     """
     Generate a pie chart showing cash allocation (spending/saving/investing)
 
     Args:
         expense_data: DataFrame with expense data
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         Dictionary with allocation data
     """
-    # Calculate the allocations
-    spending = expense_data[~expense_data[TransactionSchema.CATEGORY].isin(
-        ['Savings', 'Investments'])][TransactionSchema.AMOUNT].sum()
+    # Code each expense as 0 (spending), 1 (saving) or 2 (investing) and sum all three in one pass
+    category = expense_data[TransactionSchema.CATEGORY]
+    amount = expense_data[TransactionSchema.AMOUNT].to_numpy(dtype=float)
+    bucket = (category.eq('Savings').to_numpy(dtype=bool, na_value=False)
+              + 2 * category.eq('Investments').to_numpy(dtype=bool, na_value=False))
 
-    saving = expense_data[expense_data[TransactionSchema.CATEGORY] == 'Savings'][
-        TransactionSchema.AMOUNT].sum()
-
-    investing = expense_data[expense_data[TransactionSchema.CATEGORY] == 'Investments'][
-        TransactionSchema.AMOUNT].sum()
+    spending, saving, investing = np.bincount(bucket, weights=np.nan_to_num(amount), minlength=3)
 
     # Create allocation data
     allocation_data = [spending, saving, investing]
@@ -59,7 +62,7 @@ def generate_cash_allocation_chart(expense_data: pd.DataFrame, output_dir: str =
     plt.axis('equal')
 
     # Add title with proper styling
-    plt.title('Fund Allocation Analysis', fontweight='bold', fontsize=14, pad=15)
+    plt.title('Fund Allocation Analysis', **TITLE_STYLE)
 
     # Add a legend
     plt.legend(
@@ -70,8 +73,7 @@ def generate_cash_allocation_chart(expense_data: pd.DataFrame, output_dir: str =
     )
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'cash_allocation_pie.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'cash_allocation_pie.png', dpi, formats)
 
     # Return allocation data as dictionary
     return {
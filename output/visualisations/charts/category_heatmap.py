@@ -1,19 +1,19 @@
 """
 Category spending stacked bar chart generation for the Cashflow Tracker
 """
-from typing import Any
 
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-import os
+from typing import Sequence
 from core.schema import TransactionSchema
-from .constants import PROFESSIONAL_COLORS, money_formatter
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, LABEL_BBOX, TITLE_STYLE, chart_colors, money_formatter, save_chart
 from matplotlib.ticker import FuncFormatter
 
 
 def generate_category_stacked(expense_data: pd.DataFrame, transaction_data: pd.DataFrame,
-                              output_dir: str = '.') -> pd.DataFrame | None:
+                              output_dir: str = '.',
+                              dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.DataFrame | None:
     """
     Generate a stacked bar chart showing category spending by month
     (Formerly a heatmap, changed to stacked bar for better readability)
@@ -22,6 +22,8 @@ def generate_category_stacked(expense_data: pd.DataFrame, transaction_data: pd.D
         expense_data: DataFrame with expense data
         transaction_data: DataFrame with transaction data (for month reference)
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         DataFrame with category pivot data
@@ -33,42 +35,17 @@ def generate_category_stacked(expense_data: pd.DataFrame, transaction_data: pd.D
 
     # Check if expense_data has a Month column and add it if not
     if 'Month' not in expense_data.columns:
-        expense_data = expense_data.copy()
-        expense_data['Month'] = pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.strftime('%Y-%m')
-
-    # Create monthly pivot from transaction_data for reference
-    monthly_pivot = None
-    if 'Month' in transaction_data.columns:
-        monthly_data = transaction_data.groupby(['Month', TransactionSchema.TYPE])[
-            TransactionSchema.AMOUNT].sum().reset_index()
-        monthly_pivot = pd.pivot_table(
-            monthly_data,
-            index='Month',
-            columns=TransactionSchema.TYPE,
-            values=TransactionSchema.AMOUNT,
-            aggfunc='sum'
-        ).fillna(0)
+        expense_data = expense_data.assign(
+            Month=pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.strftime('%Y-%m'))
 
     # Check if we have enough data for a chart
-    if monthly_pivot is None or len(monthly_pivot) <= 1:
+    if transaction_data['Month'].nunique() <= 1:
         print("Warning: Not enough monthly data for a category chart")
         return None
 
-    # Aggregate expenses by category and month
-    category_monthly = expense_data.groupby(['Month', TransactionSchema.CATEGORY])[
-        TransactionSchema.AMOUNT].sum().reset_index()
-
-    # Pivot to get categories as columns and months as rows
-    category_pivot = pd.pivot_table(
-        category_monthly,
-        index='Month',
-        columns=TransactionSchema.CATEGORY,
-        values=TransactionSchema.AMOUNT,
-        aggfunc='sum'
-    ).fillna(0)
-
-    # Sort by month
-    category_pivot = category_pivot.sort_index()
+    # Aggregate expenses by month and category, with categories as columns
+    category_pivot = expense_data.groupby(['Month', TransactionSchema.CATEGORY], observed=True)[
+        TransactionSchema.AMOUNT].sum().unstack(fill_value=0).sort_index()
 
     # Create figure with good size for time series
     fig, ax = plt.subplots(figsize=(14, 8), facecolor='white')
@@ -76,47 +53,43 @@ def generate_category_stacked(expense_data: pd.DataFrame, transaction_data: pd.D
     # Get a list of categories (columns)
     categories = category_pivot.columns
 
-    # Create a numpy array for the bottom positions of each stack
-    bottoms = np.zeros(len(category_pivot))
+    # Month x category amounts, and the bottom position of every segment in its stack
+    values = category_pivot.to_numpy(dtype=float)
+    bottoms = np.zeros_like(values)
+    np.cumsum(values[:, :-1], axis=1, out=bottoms[:, 1:])
 
-    # Plot each category as a stacked bar
+    # Plot each category as a stacked bar, cycling through the palette if needed
+    colors = chart_colors(len(categories))
     for i, category in enumerate(categories):
-        values = category_pivot[category].values
-        color_idx = i % len(PROFESSIONAL_COLORS)  # cycle through colors if more categories than colors
-
-        bars = ax.bar(
+        ax.bar(
             category_pivot.index,
-            values,
-            bottom=bottoms,
+            values[:, i],
+            bottom=bottoms[:, i],
             label=category,
-            color=PROFESSIONAL_COLORS[color_idx],
+            color=colors[i],
             width=0.7,
             edgecolor='white',
             linewidth=0.5
         )
 
-        # Add data labels to bars that are large enough
-        for j, (value, bottom) in enumerate(zip(values, bottoms)):
-            if value > category_pivot.values.sum() * 0.03:  # Only label if > 3% of total spending
-                # Position text in middle of segment
-                ax.text(
-                    j,
-                    bottom + value/2,
-                    f'${value:,.0f}',
-                    ha='center',
-                    va='center',
-                    fontsize=8,
-                    fontweight='bold',
-                    color='white'
-                )
-
-        # Update the bottom position for the next category
-        bottoms += values
+    # Add data labels in the middle of segments above 3% of total spending, picked with one mask
+    category_idx, month_idx = np.nonzero(values.T > values.sum() * 0.03)
+    for i, j in zip(category_idx, month_idx):
+        ax.text(
+            j,
+            bottoms[j, i] + values[j, i] / 2,
+            f'${values[j, i]:,.0f}',
+            ha='center',
+            va='center',
+            fontsize=8,
+            fontweight='bold',
+            color='white'
+        )
 
     # Add proper styling
-    ax.set_title('Monthly Expenditure by Category', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Month', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Amount ($)', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Monthly Expenditure by Category', **TITLE_STYLE)
+    ax.set_xlabel('Month', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Amount ($)', **AXIS_LABEL_STYLE)
 
     # Format y-axis as currency
     ax.yaxis.set_major_formatter(FuncFormatter(money_formatter))
@@ -138,8 +111,7 @@ def generate_category_stacked(expense_data: pd.DataFrame, transaction_data: pd.D
     plt.xticks(rotation=45, ha='right')
 
     # Add total amount on top of each bar
-    for i, month in enumerate(category_pivot.index):
-        total = category_pivot.iloc[i].sum()
+    for i, total in enumerate(category_pivot.sum(axis=1).tolist()):
         ax.text(
             i,
             total * 1.02,  # Slightly above the bar
@@ -149,12 +121,11 @@ def generate_category_stacked(expense_data: pd.DataFrame, transaction_data: pd.D
             fontsize=9,
             fontweight='bold',
             color='black',
-            bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='lightgray', alpha=0.7)
+            bbox=LABEL_BBOX
         )
 
     plt.tight_layout()
     # Use a new filename to avoid overwriting the old heatmap
-    plt.savefig(os.path.join(output_dir, 'category_month_stacked.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'category_month_stacked.png', dpi, formats)
 
     return category_pivot
\ No newline at end of file
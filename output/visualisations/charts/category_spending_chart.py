@@ -4,24 +4,30 @@ Category spending chart generation for the Cashflow Tracker
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import os
+from typing import Optional, Sequence
 from core.schema import TransactionSchema
-from .constants import PROFESSIONAL_COLORS
+from .constants import DEFAULT_DPI, TITLE_STYLE, chart_colors, group_totals, save_chart
 
 
-def generate_spending_by_category_chart(expense_data: pd.DataFrame, output_dir: str = '.') -> pd.Series:
+def generate_spending_by_category_chart(expense_data: pd.DataFrame, output_dir: str = '.',
+                                        category_totals: Optional[pd.Series] = None,
+                                        dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.Series:
     """
     Generate a pie chart showing spending by category
 
     Args:
         expense_data: DataFrame with expense data
         output_dir: Directory to save images
+        category_totals: Precomputed expense totals per category (computed from expense_data if omitted)
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         Series containing category totals
     """
     # Calculate category totals
-    category_totals = expense_data.groupby(TransactionSchema.CATEGORY)[TransactionSchema.AMOUNT].sum()
+    if category_totals is None:
+        category_totals = group_totals(expense_data, TransactionSchema.CATEGORY)
 
     # Sort by value for better visualization
     category_totals = category_totals.sort_values(ascending=False)
@@ -34,7 +40,7 @@ def generate_spending_by_category_chart(expense_data: pd.DataFrame, output_dir:
         labels=None,  # We'll use a legend instead
         autopct='%1.1f%%',
         startangle=90,
-        colors=PROFESSIONAL_COLORS[:len(category_totals)],
+        colors=chart_colors(len(category_totals)),
         wedgeprops={'edgecolor': 'white', 'linewidth': 1.5},
         textprops={'fontsize': 9},
         pctdistance=0.85
@@ -52,7 +58,7 @@ def generate_spending_by_category_chart(expense_data: pd.DataFrame, output_dir:
     plt.axis('equal')
 
     # Add title with proper styling
-    plt.title('Expenditure Distribution by Category', fontweight='bold', fontsize=14, pad=15)
+    plt.title('Expenditure Distribution by Category', **TITLE_STYLE)
 
     # Add a legend with category names
     plt.legend(
@@ -64,7 +70,6 @@ def generate_spending_by_category_chart(expense_data: pd.DataFrame, output_dir:
     )
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'category_spending_pie.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'category_spending_pie.png', dpi, formats)
 
     return category_totals
\ No newline at end of file
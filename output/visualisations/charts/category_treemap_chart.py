@@ -5,24 +5,30 @@ Category treemap chart generation for the Cashflow Tracker
 import matplotlib.pyplot as plt
 import squarify
 import pandas as pd
-import os
+from typing import Optional, Sequence
 from core.schema import TransactionSchema
-from .constants import PROFESSIONAL_COLORS
+from .constants import DEFAULT_DPI, TITLE_STYLE, chart_colors, group_totals, save_chart
 
 
-def generate_category_treemap(expense_data: pd.DataFrame, output_dir: str = '.') -> pd.DataFrame:
+def generate_category_treemap(expense_data: pd.DataFrame, output_dir: str = '.',
+                              category_totals: Optional[pd.Series] = None,
+                              dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.DataFrame:
     """
     Generate a treemap showing proportion of spending by category
 
     Args:
         expense_data: DataFrame with expense data
         output_dir: Directory to save images
+        category_totals: Precomputed expense totals per category (computed from expense_data if omitted)
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         DataFrame with category data
     """
     # Aggregate by category
-    category_totals = expense_data.groupby(TransactionSchema.CATEGORY)[TransactionSchema.AMOUNT].sum()
+    if category_totals is None:
+        category_totals = group_totals(expense_data, TransactionSchema.CATEGORY)
 
     # Sort by value for better visualization
     category_totals = category_totals.sort_values(ascending=False)
@@ -30,22 +36,27 @@ def generate_category_treemap(expense_data: pd.DataFrame, output_dir: str = '.')
     # Create figure
     plt.figure(figsize=(12, 8), facecolor='white')
 
+    # Only label tiles of at least 2% of the total; smaller ones are too small to read
+    sizes = category_totals.to_numpy()
+    shares = sizes / sizes.sum()
+    labels = [f"{cat}\n${amt:,.0f}" if share >= 0.02 else ''
+              for cat, amt, share in zip(category_totals.index, sizes, shares)]
+
     # Create treemap
     squarify.plot(
-        sizes=category_totals.values,
-        label=[f"{cat}\n${amt:,.0f}" for cat, amt in zip(category_totals.index, category_totals.values)],
+        sizes=sizes,
+        label=labels,
         alpha=0.8,
-        color=PROFESSIONAL_COLORS[:len(category_totals)],
+        color=chart_colors(len(category_totals)),
         pad=True,
         text_kwargs={'fontsize': 12, 'fontweight': 'bold'}
     )
 
     # Add title
-    plt.title('Expenditure Distribution by Category', fontweight='bold', fontsize=14, pad=15)
+    plt.title('Expenditure Distribution by Category', **TITLE_STYLE)
     plt.axis('off')  # Turn off axis
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'category_treemap.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'category_treemap.png', dpi, formats)
 
     return category_totals
\ No newline at end of file
@@ -3,6 +3,14 @@
 Constants for chart generation in the Cashflow Tracker
 """
 
+import os
+from itertools import cycle, islice
+from typing import List, Sequence
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from core.schema import TransactionSchema
+
 # Set up styling constants
 PROFESSIONAL_COLORS = [
     '#4c72b0',  # blue
@@ -15,6 +23,59 @@ PROFESSIONAL_COLORS = [
     '#dd8452',  # orange
 ]
 
+# Resolution of saved chart images; plenty for screens, use 300 for print
+DEFAULT_DPI = 150
+
+# Day names in calendar order, as used for the Weekday column
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Box drawn behind total/value labels; matplotlib copies it, so one dict serves every label
+LABEL_BBOX = {'boxstyle': 'round,pad=0.3', 'facecolor': 'white', 'edgecolor': 'lightgray', 'alpha': 0.7}
+
+# Keywords for chart titles and axis labels, shared so every chart is styled alike
+TITLE_STYLE = {'fontweight': 'bold', 'fontsize': 14, 'pad': 15}
+AXIS_LABEL_STYLE = {'fontweight': 'bold', 'fontsize': 12, 'labelpad': 10}
+
+
+def chart_colors(count: int) -> List[str]:
+    """Return count palette colors, repeating the palette when there are more items than colors"""
+    return list(islice(cycle(PROFESSIONAL_COLORS), count))
+
+
 def money_formatter(x, pos):
     """Format y-axis ticks as currency values"""
-    return f'${x:,.0f}'
\ No newline at end of file
+    return f'${x:,.0f}'
+
+
+def group_totals(data: pd.DataFrame, column: str) -> pd.Series:
+    """Sum amounts per value of column with one weighted bincount over the factorized keys"""
+    codes, labels = pd.factorize(data[column], sort=True)
+    amount = np.nan_to_num(data[TransactionSchema.AMOUNT].to_numpy(dtype=float))
+    present = codes >= 0
+    return pd.Series(
+        np.bincount(codes[present], weights=amount[present], minlength=len(labels)),
+        index=pd.Index(np.asarray(labels), name=column),
+        name=TransactionSchema.AMOUNT
+    )
+
+
+def save_chart(output_dir: str, filename: str, dpi: int = DEFAULT_DPI,
+               formats: Sequence[str] = ('png',)) -> None:
+    """
+    Save the current figure in output_dir in each format and close it
+
+    Args:
+        output_dir: Directory to save images
+        filename: File name of the image; its extension is replaced by each format
+        dpi: Resolution of the saved images
+        formats: File formats to write, e.g. ('png', 'svg')
+    """
+    # zlib level 1 encodes much faster than the default 6 for somewhat larger files;
+    # the tight bounding box keeps legends placed outside the axes in the image
+    fig = plt.gcf()
+    stem = os.path.splitext(filename)[0]
+    for file_format in formats:
+        options = {'pil_kwargs': {'compress_level': 1}} if file_format == 'png' else {}
+        fig.savefig(os.path.join(output_dir, f'{stem}.{file_format}'), dpi=dpi, bbox_inches='tight', **options)
+    fig.clf()
+    plt.close(fig)
@@ -3,20 +3,24 @@ Cumulative cashflow chart generation for the Cashflow Tracker
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import os
+from typing import Sequence
 from matplotlib.ticker import FuncFormatter
 from core.schema import TransactionSchema
-from .constants import money_formatter
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, TITLE_STYLE, money_formatter, save_chart
 
 
-def generate_cumulative_cashflow_chart(transaction_data: pd.DataFrame, output_dir: str = '.') -> pd.DataFrame:
+def generate_cumulative_cashflow_chart(transaction_data: pd.DataFrame, output_dir: str = '.',
+                                       dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.DataFrame:
     """
     Generate a line chart showing cumulative cashflow over time
 
     Args:
         transaction_data: DataFrame with transaction data
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         DataFrame with cumulative cashflow data
@@ -26,36 +30,30 @@ def generate_cumulative_cashflow_chart(transaction_data: pd.DataFrame, output_di
         transaction_data = transaction_data.copy()
         transaction_data['Date'] = pd.to_datetime(transaction_data[TransactionSchema.DATE])
 
-    # Sort by date
-    sorted_data = transaction_data.sort_values('Date')
-
-    # Group by date and type
-    daily_data = sorted_data.groupby(['Date', TransactionSchema.TYPE])[
-        TransactionSchema.AMOUNT].sum().reset_index()
-
-    # Pivot to have Income and Expense columns
-    daily_pivot = pd.pivot_table(
-        daily_data,
-        index='Date',
-        columns=TransactionSchema.TYPE,
-        values=TransactionSchema.AMOUNT,
-        aggfunc='sum'
-    ).fillna(0).reset_index()
-
-    # Calculate cumulative sums
-    if 'Income' in daily_pivot.columns:
-        daily_pivot['Cumulative Income'] = daily_pivot['Income'].cumsum()
-    else:
-        daily_pivot['Cumulative Income'] = 0
-        daily_pivot['Income'] = 0
-
-    if 'Expense' in daily_pivot.columns:
-        daily_pivot['Cumulative Expense'] = daily_pivot['Expense'].cumsum()
-    else:
-        daily_pivot['Cumulative Expense'] = 0
-        daily_pivot['Expense'] = 0
-
-    daily_pivot['Net Cashflow'] = daily_pivot['Cumulative Income'] - daily_pivot['Cumulative Expense']
+    # Total income and expense per day: factorizing with sort=True orders the days
+    day_codes, days = pd.factorize(transaction_data['Date'], sort=True)
+    amounts = np.nan_to_num(transaction_data[TransactionSchema.AMOUNT].to_numpy(dtype=float))
+    types = transaction_data[TransactionSchema.TYPE]
+    valid = day_codes >= 0
+
+    def daily_totals(label: str) -> np.ndarray:
+        mask = valid & types.eq(label).to_numpy(dtype=bool, na_value=False)
+        return np.bincount(day_codes[mask], weights=amounts[mask], minlength=len(days))
+
+    income = daily_totals('Income')
+    expense = daily_totals('Expense')
+    cumulative_income = income.cumsum()
+    cumulative_expense = expense.cumsum()
+    net_cashflow = cumulative_income - cumulative_expense
+
+    daily_pivot = pd.DataFrame({
+        'Date': days,
+        'Expense': expense,
+        'Income': income,
+        'Cumulative Income': cumulative_income,
+        'Cumulative Expense': cumulative_expense,
+        'Net Cashflow': net_cashflow
+    })
 
     # Create figure
     fig, ax = plt.subplots(figsize=(14, 8), facecolor='white')
@@ -101,9 +99,9 @@ def generate_cumulative_cashflow_chart(transaction_data: pd.DataFrame, output_di
     )
 
     # Add proper styling
-    ax.set_title('Cumulative Financial Flow Analysis', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Date', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Amount', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Cumulative Financial Flow Analysis', **TITLE_STYLE)
+    ax.set_xlabel('Date', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Amount', **AXIS_LABEL_STYLE)
 
     # Format y-axis as currency
     ax.yaxis.set_major_formatter(FuncFormatter(money_formatter))
@@ -121,11 +119,11 @@ def generate_cumulative_cashflow_chart(transaction_data: pd.DataFrame, output_di
 
     # Add annotations for key points with improved styling
     if len(daily_pivot) > 0:
-        max_net = daily_pivot['Net Cashflow'].max()
-        max_net_date = daily_pivot.loc[daily_pivot['Net Cashflow'].idxmax(), 'Date']
+        max_index = net_cashflow.argmax()
+        max_net, max_net_date = net_cashflow[max_index], days[max_index]
 
-        min_net = daily_pivot['Net Cashflow'].min()
-        min_net_date = daily_pivot.loc[daily_pivot['Net Cashflow'].idxmin(), 'Date']
+        min_index = net_cashflow.argmin()
+        min_net, min_net_date = net_cashflow[min_index], days[min_index]
 
         # Annotation for maximum
         ax.annotate(
@@ -168,7 +166,6 @@ def generate_cumulative_cashflow_chart(transaction_data: pd.DataFrame, output_di
         )
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'cumulative_cashflow.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'cumulative_cashflow.png', dpi, formats)
 
     return daily_pivot
\ No newline at end of file
@@ -4,27 +4,30 @@ Daily spending chart generation for the Cashflow Tracker
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import os
+from typing import Sequence
 from matplotlib.ticker import FuncFormatter
 from core.schema import TransactionSchema
-from .constants import money_formatter
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, LABEL_BBOX, TITLE_STYLE, money_formatter, save_chart
 
 
-def generate_daily_spending_chart(expense_data: pd.DataFrame, output_dir: str = '.') -> pd.Series:
+def generate_daily_spending_chart(expense_data: pd.DataFrame, output_dir: str = '.',
+                                  dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.Series:
     """
     Generate a line chart showing spending by day of month
 
     Args:
         expense_data: DataFrame with expense data
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         Series containing daily spending data
     """
     # Ensure expense_data has the 'Day' column
     if 'Day' not in expense_data.columns:
-        expense_data = expense_data.copy()
-        expense_data['Day'] = pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.day
+        expense_data = expense_data.assign(
+            Day=pd.to_numeric(pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.day, downcast='integer'))
 
     # Aggregate by day of month
     daily_spending = expense_data.groupby('Day')[TransactionSchema.AMOUNT].sum()
@@ -58,9 +61,9 @@ def generate_daily_spending_chart(expense_data: pd.DataFrame, output_dir: str =
     )
 
     # Add title and labels with proper styling
-    ax.set_title('Daily Expenditure Pattern Analysis', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Day of Month', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Total Expenditure', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Daily Expenditure Pattern Analysis', **TITLE_STYLE)
+    ax.set_xlabel('Day of Month', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Total Expenditure', **AXIS_LABEL_STYLE)
 
     # Format y-axis as currency
     ax.yaxis.set_major_formatter(FuncFormatter(money_formatter))
@@ -90,11 +93,10 @@ def generate_daily_spending_chart(expense_data: pd.DataFrame, output_dir: str =
         fontsize=9,
         color='#c44e52',
         fontweight='bold',
-        bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='lightgray', alpha=0.7)
+        bbox=LABEL_BBOX
     )
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'spending_by_day.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'spending_by_day.png', dpi, formats)
 
     return daily_spending
\ No newline at end of file
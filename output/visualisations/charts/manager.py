@@ -6,12 +6,16 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import os
-from typing import Optional, Any
+import hashlib
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Any, Callable, Sequence, Tuple
 from typing import List
 from core.schema import TransactionSchema
 
 # Import constants
-from .constants import PROFESSIONAL_COLORS, money_formatter
+from .constants import DEFAULT_DPI, PROFESSIONAL_COLORS, WEEKDAYS, group_totals
 
 # Import individual chart functions
 from .category_spending_chart import generate_spending_by_category_chart
@@ -35,6 +39,29 @@ from .sankey_flow_chart import generate_sankey_flow_diagram
 # etc.
 
 
+# Columns read by the chart generators, including those added by _with_time_columns
+_CHART_COLUMNS = (TransactionSchema.DATE, TransactionSchema.TYPE, TransactionSchema.CATEGORY,
+                  TransactionSchema.PRODUCER, TransactionSchema.AMOUNT, 'Month', 'Day', 'Weekday')
+
+# Image written by each chart type, and the file recording the data each image was drawn from
+_CHART_FILES = {
+    'category_spending': 'category_spending_pie.png',
+    'cash_allocation': 'cash_allocation_pie.png',
+    'monthly_comparison': 'monthly_comparison_bar.png',
+    'net_cashflow': 'net_cashflow_line.png',
+    'category_heatmap': 'category_month_stacked.png',
+    'top_vendors': 'top_producers_bar.png',
+    'daily_spending': 'spending_by_day.png',
+    'weekday_spending': 'spending_by_weekday.png',
+    'cumulative_cashflow': 'cumulative_cashflow.png',
+    'monthly_category_proportion': 'monthly_category_proportion.png',
+    'category_treemap': 'category_treemap.png',
+    'sankey_flow': 'cashflow_sankey.png',
+    'budget_comparison': 'budget_vs_actual.png',
+}
+_CHART_CACHE_FILE = '.chart_cache.json'
+
+
 def set_professional_style():
     """Configure matplotlib for professional/academic visualisations"""
     plt.rcParams.update({
@@ -62,10 +89,89 @@ def set_professional_style():
     # Make sure we're using our color palette
     sns.set_palette(PROFESSIONAL_COLORS)
 
+
+def _with_time_columns(transaction_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the date-related columns used by the charts
+
+    Args:
+        transaction_data: DataFrame with transaction data
+
+    Returns:
+        Copy of the DataFrame with Month, Day, Weekday and Date columns
+    """
+    dates = transaction_data[TransactionSchema.DATE]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
+
+    # Format each distinct month and weekday once instead of formatting every row;
+    # missing dates get the -1 (missing) code
+    weekday_codes = dates.dt.dayofweek.fillna(-1).astype('int8')
+    return transaction_data.assign(
+        Month=dates.dt.to_period('M').astype('category').cat.rename_categories(str),
+        Day=pd.to_numeric(dates.dt.day, downcast='integer'),
+        Weekday=pd.Categorical.from_codes(weekday_codes, categories=WEEKDAYS),
+        Date=dates
+    )
+
+
+def _data_fingerprint(transaction_data: pd.DataFrame, budget_data: Optional[pd.DataFrame],
+                      dpi: int, formats: Sequence[str]) -> str:
+    """
+    Hash everything the charts are drawn from
+
+    Args:
+        transaction_data: DataFrame with the chart columns
+        budget_data: Optional DataFrame with budget information
+        dpi: Resolution of the saved images
+        formats: File formats the images are saved in
+
+    Returns:
+        Hex digest that changes whenever any chart could change
+    """
+    digest = hashlib.sha1(repr((dpi, tuple(formats), list(transaction_data.columns))).encode())
+    digest.update(pd.util.hash_pandas_object(transaction_data, index=False).to_numpy().tobytes())
+    if budget_data is not None:
+        # Budget rows can hold lists, which are not hashable, so hash their text instead
+        digest.update(pd.util.hash_pandas_object(budget_data.astype(str), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _chart_files(output_dir: str, chart_type: str, formats: Sequence[str]) -> List[str]:
+    """
+    List the files a chart is saved to
+
+    Args:
+        output_dir: Directory the images are saved in
+        chart_type: Key of the chart in _CHART_FILES
+        formats: File formats the images are saved in
+
+    Returns:
+        Path of the chart's image in each format
+    """
+    stem = os.path.splitext(_CHART_FILES[chart_type])[0]
+    return [os.path.join(output_dir, f'{stem}.{fmt}') for fmt in formats]
+
+
+def _modified_time(path: str) -> Optional[float]:
+    """Return the modification time of a file, or None if it does not exist"""
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+def _render_chart(chart: Tuple[Callable[..., Any], tuple, dict]) -> Any:
+    """Render one chart from a (generator, arguments, keyword arguments) triple"""
+    generate, args, kwargs = chart
+    return generate(*args, **kwargs)
+
+
 def create_visualisations(transaction_data: pd.DataFrame,
                           output_dir: str = '.',
                           budget_data: Optional[pd.DataFrame] = None,
-                          chart_types: Optional[List[str]] = None) -> dict[Any, Any]:
+                          chart_types: Optional[List[str]] = None,
+                          max_workers: Optional[int] = None,
+                          dpi: int = DEFAULT_DPI,
+                          reuse_unchanged: bool = False,
+                          formats: Sequence[str] = ('png',)) -> dict[Any, Any]:
     """
     Create visualisations and save as image files
 
@@ -74,45 +180,64 @@ def create_visualisations(transaction_data: pd.DataFrame,
         output_dir: Directory to save images
         budget_data: Optional DataFrame with budget information
         chart_types: Optional list of chart types to generate (generates all if None)
+        max_workers: Number of processes rendering charts (defaults to the CPU count;
+            1 renders everything in the current process)
+        dpi: Resolution of the saved images; the default suits screens, use 300 for print
+        reuse_unchanged: Skip charts whose images already exist in output_dir in every
+            format and were drawn from identical data at the same dpi by a previous run
+        formats: File formats each chart is saved in; add 'svg' or 'pdf' for vector copies
+
+    Returns:
+        Dict mapping each chart type drawn in this run to the data its generator returned;
+        charts skipped by reuse_unchanged are not included
     """
     # Ensure output directory exists
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     # Set professional style
     set_professional_style()
 
-    # Create a copy to avoid modifying the original dataframe
-    transaction_data = transaction_data.copy()
+    # Group on category codes rather than strings; cleaned data already arrives categorical
+    key_columns = {
+        column: transaction_data[column].astype('category')
+        for column in (TransactionSchema.TYPE, TransactionSchema.CATEGORY, TransactionSchema.PRODUCER)
+        if column in transaction_data.columns
+        and not isinstance(transaction_data[column].dtype, pd.CategoricalDtype)
+    }
+    transaction_data = _with_time_columns(transaction_data.assign(**key_columns))
+
+    # Keep only the columns the charts read, so less data is pickled to each worker
+    transaction_data = transaction_data[[column for column in _CHART_COLUMNS if column in transaction_data.columns]]
 
-    # Filter for expenses
-    expense_data = transaction_data[transaction_data[TransactionSchema.TYPE] == 'Expense'].copy()
+    # Filter for expenses once; the slice carries the date-related columns too
+    is_expense = transaction_data[TransactionSchema.TYPE].eq('Expense').to_numpy(dtype=bool, na_value=False)
+    expense_data = transaction_data.loc[is_expense]
 
-    # Add date-related columns
-    transaction_data['Month'] = pd.to_datetime(transaction_data[TransactionSchema.DATE]).dt.strftime('%Y-%m')
-    transaction_data['Day'] = pd.to_datetime(transaction_data[TransactionSchema.DATE]).dt.day
-    transaction_data['Weekday'] = pd.to_datetime(transaction_data[TransactionSchema.DATE]).dt.day_name()
-    transaction_data['Date'] = pd.to_datetime(transaction_data[TransactionSchema.DATE])
+    # Category totals feed several charts, so aggregate them once
+    category_totals = group_totals(expense_data, TransactionSchema.CATEGORY)
 
+    # The net cashflow chart is drawn from monthly totals with one column per type
+    monthly_pivot = transaction_data.groupby(['Month', TransactionSchema.TYPE], observed=True)[
+        TransactionSchema.AMOUNT].sum().unstack(fill_value=0)
 
-    # Define all available charts
+    # Define all available charts as (generator, arguments) pairs so they can be sent to worker processes
     all_charts = {
         # Basic charts
-        'category_spending': lambda: generate_spending_by_category_chart(expense_data, output_dir),
-        'cash_allocation': lambda: generate_cash_allocation_chart(expense_data, output_dir),
-        'monthly_comparison': lambda: generate_monthly_comparison_chart(transaction_data, output_dir),
-        'net_cashflow': lambda: generate_net_cashflow_chart(transaction_data, output_dir),
-        'category_heatmap': lambda: generate_category_stacked(expense_data, transaction_data, output_dir),
-        'top_vendors': lambda: generate_top_vendors_chart(expense_data, output_dir),
+        'category_spending': (generate_spending_by_category_chart, (expense_data, output_dir, category_totals)),
+        'cash_allocation': (generate_cash_allocation_chart, (expense_data, output_dir)),
+        'monthly_comparison': (generate_monthly_comparison_chart, (transaction_data, output_dir)),
+        'net_cashflow': (generate_net_cashflow_chart, (monthly_pivot, output_dir)),
+        'category_heatmap': (generate_category_stacked, (expense_data, transaction_data, output_dir)),
+        'top_vendors': (generate_top_vendors_chart, (expense_data, output_dir)),
 
         # Advanced charts
-        'daily_spending': lambda: generate_daily_spending_chart(expense_data, output_dir),
-        'weekday_spending': lambda: generate_weekday_spending_chart(expense_data, output_dir),
-        'cumulative_cashflow': lambda: generate_cumulative_cashflow_chart(transaction_data, output_dir),
+        'daily_spending': (generate_daily_spending_chart, (expense_data, output_dir)),
+        'weekday_spending': (generate_weekday_spending_chart, (expense_data, output_dir)),
+        'cumulative_cashflow': (generate_cumulative_cashflow_chart, (transaction_data, output_dir)),
 
-        'monthly_category_proportion': lambda: generate_monthly_category_proportion(expense_data, output_dir),
-        'category_treemap': lambda: generate_category_treemap(expense_data, output_dir),
-        'sankey_flow': lambda: generate_sankey_flow_diagram(expense_data, output_dir),
+        'monthly_category_proportion': (generate_monthly_category_proportion, (expense_data, output_dir)),
+        'category_treemap': (generate_category_treemap, (expense_data, output_dir, category_totals)),
+        'sankey_flow': (generate_sankey_flow_diagram, (expense_data, output_dir)),
 
         # Add more charts as they are implemented,
         # etc.
@@ -120,32 +245,61 @@ def create_visualisations(transaction_data: pd.DataFrame,
 
     # Add budget-dependent charts if budget data is provided
     if budget_data is not None:
-        all_charts['budget_comparison'] = lambda: generate_budget_comparison_chart(expense_data, budget_data, output_dir)
+        all_charts['budget_comparison'] = (generate_budget_comparison_chart,
+                                          (expense_data, budget_data, output_dir, category_totals))
 
     # Determine which charts to generate
     charts_to_generate = chart_types if chart_types else all_charts.keys()
 
-    # Generate selected charts
-    results = {}
+    # Charts drawn from the same data as last time can keep their existing images
+    cache_path = os.path.join(output_dir, _CHART_CACHE_FILE)
+    fingerprint = _data_fingerprint(transaction_data, budget_data, dpi, formats) if reuse_unchanged else None
+    cache = {}
+    if reuse_unchanged and os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
 
-    # Generate selected charts
+    jobs = {}
     for chart_type in charts_to_generate:
         if chart_type in all_charts:
+            if (reuse_unchanged and cache.get(chart_type) == fingerprint
+                    and all(map(os.path.exists, _chart_files(output_dir, chart_type, formats)))):
+                print(f"Reusing unchanged {chart_type} chart...")
+                continue
             print(f"Generating {chart_type} chart...")
-            all_charts[chart_type]()
+            generate, args = all_charts[chart_type]
+            # The Sankey diagram is exported by plotly, which sizes images in pixels rather than dpi
+            save_options = {'formats': tuple(formats)} if chart_type == 'sankey_flow' else {
+                'dpi': dpi, 'formats': tuple(formats)}
+            jobs[chart_type] = (generate, args, save_options)
+            cache.pop(chart_type, None)
         else:
             print(f"Warning: Chart type '{chart_type}' not recognized")
 
-    # Handle dependent charts
-    if 'monthly_comparison' in results:
-        monthly_pivot = results.get('monthly_comparison')
-
-        if 'net_cashflow' in charts_to_generate or chart_types is None:
-            print("Generating net cashflow chart...")
-            results['net_cashflow'] = generate_net_cashflow_chart(transaction_data, output_dir)
+    # Each chart is an independent, CPU-bound render, so spread them across processes.
+    # Workers are spawned rather than forked: callers such as the CLI may have other
+    # threads running (e.g. saving the workbook), and forking a threaded process can deadlock
+    previous_times = {
+        chart_type: [_modified_time(path) for path in _chart_files(output_dir, chart_type, formats)]
+        for chart_type in jobs
+    } if reuse_unchanged else {}
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=set_professional_style) as executor:
+            rendered = list(executor.map(_render_chart, jobs.values()))
+    else:
+        rendered = [_render_chart(job) for job in jobs.values()]
 
-        if 'category_heatmap' in charts_to_generate or chart_types is None:
-            print("Generating category heatmap...")
-            results['category_heatmap'] = generate_category_stacked(expense_data, monthly_pivot, output_dir)
+    if reuse_unchanged:
+        # Only remember charts that actually wrote every file; generators that return
+        # early (e.g. for too little data) leave any older images untouched
+        for chart_type, before in previous_times.items():
+            after = [_modified_time(path) for path in _chart_files(output_dir, chart_type, formats)]
+            if all(modified is not None and modified != old for modified, old in zip(after, before)):
+                cache[chart_type] = fingerprint
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f, indent=2)
 
-    return results
\ No newline at end of file
+    # Data behind each chart drawn in this run, keyed by chart type
+    return dict(zip(jobs, rendered))
@@ -5,12 +5,13 @@ Monthly category proportion chart generation for the Cashflow Tracker
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-import os
+from typing import Sequence
 from core.schema import TransactionSchema
-from .constants import PROFESSIONAL_COLORS
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, TITLE_STYLE, chart_colors, save_chart
 
 
-def generate_monthly_category_proportion(expense_data: pd.DataFrame, output_dir: str = '.') -> pd.DataFrame:
+def generate_monthly_category_proportion(expense_data: pd.DataFrame, output_dir: str = '.',
+                                         dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.DataFrame:
     """
     Generate a stacked bar chart showing monthly spending by category proportion.
     Each month's total spending is represented as a full bar, with categories as proportions.
@@ -18,40 +19,31 @@ def generate_monthly_category_proportion(expense_data: pd.DataFrame, output_dir:
     Args:
         expense_data: DataFrame with expense data
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         DataFrame with monthly category proportion data
     """
     # Check if expense_data has a Month column
     if 'Month' not in expense_data.columns:
-        expense_data = expense_data.copy()
-        expense_data['Month'] = pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.strftime('%Y-%m')
+        expense_data = expense_data.assign(
+            Month=pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.strftime('%Y-%m'))
 
-    # Aggregate by month and category
-    monthly_category = expense_data.groupby(['Month', TransactionSchema.CATEGORY])[
-        TransactionSchema.AMOUNT].sum().reset_index()
+    # Aggregate by month and category once; monthly totals come from the same result
+    amounts = expense_data.groupby(['Month', TransactionSchema.CATEGORY], observed=True)[
+        TransactionSchema.AMOUNT].sum()
+    totals = amounts.groupby(level='Month', observed=True).transform('sum')
+    percentages = amounts / totals * 100
 
-    # Calculate the total amount per month
-    monthly_total = expense_data.groupby('Month')[TransactionSchema.AMOUNT].sum().reset_index()
-    monthly_total = monthly_total.rename(columns={TransactionSchema.AMOUNT: 'Total'})
+    monthly_category = pd.DataFrame({
+        TransactionSchema.AMOUNT: amounts,
+        'Total': totals,
+        'Percentage': percentages
+    }).reset_index()
 
-    # Merge with totals
-    monthly_category = pd.merge(monthly_category, monthly_total, on='Month')
-
-    # Calculate percentage of total for each category
-    monthly_category['Percentage'] = monthly_category[TransactionSchema.AMOUNT] / monthly_category['Total'] * 100
-
-    # Pivot data for plotting
-    pivot_data = pd.pivot_table(
-        monthly_category,
-        index='Month',
-        columns=TransactionSchema.CATEGORY,
-        values='Percentage',
-        aggfunc='sum'
-    ).fillna(0)
-
-    # Sort by month
-    pivot_data = pivot_data.sort_index()
+    # Pivot data for plotting, sorted by month
+    pivot_data = percentages.unstack(fill_value=0).sort_index()
 
     # If not enough months, return early
     if len(pivot_data) <= 1:
@@ -64,28 +56,29 @@ def generate_monthly_category_proportion(expense_data: pd.DataFrame, output_dir:
     # Get categories
     categories = pivot_data.columns
 
-    # Create stacked bar chart
-    bottom = np.zeros(len(pivot_data))
+    # Month x category percentages, and the bottom position of every segment in its stack
+    values = pivot_data.to_numpy(dtype=float)
+    bottoms = np.zeros_like(values)
+    np.cumsum(values[:, :-1], axis=1, out=bottoms[:, 1:])
 
+    # Create stacked bar chart
+    colors = chart_colors(len(categories))
     for i, category in enumerate(categories):
-        values = pivot_data[category].values
         ax.bar(
             pivot_data.index,
-            values,
-            bottom=bottom,
+            values[:, i],
+            bottom=bottoms[:, i],
             label=category,
-            color=PROFESSIONAL_COLORS[i % len(PROFESSIONAL_COLORS)],
+            color=colors[i],
             width=0.7,
             edgecolor='white',
             linewidth=0.7
         )
-        # Update bottom for next stack
-        bottom += values
 
     # Add title and labels
-    ax.set_title('Monthly Expenditure Breakdown', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Month', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Percentage of Monthly Total (%)', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Monthly Expenditure Breakdown', **TITLE_STYLE)
+    ax.set_xlabel('Month', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Percentage of Monthly Total (%)', **AXIS_LABEL_STYLE)
 
     # Add legend
     ax.legend(
@@ -106,23 +99,17 @@ def generate_monthly_category_proportion(expense_data: pd.DataFrame, output_dir:
     # Add subtle grid on y-axis only
     ax.grid(axis='y', linestyle='--', alpha=0.3)
 
-    # Add data labels for significant segments (>10%)
-    for i, category in enumerate(categories):
-        values = pivot_data[category].values
-        prev_bottom = bottom - values
-        for j, (value, start) in enumerate(zip(values, prev_bottom)):
-            if value > 10:  # Only label segments larger than 10%
-                # Position text in the middle of each segment
-                y_pos = start + value / 2
-                ax.text(
-                    j, y_pos, f'{value:.1f}%',
-                    ha='center', va='center',
-                    fontsize=9, fontweight='bold',
-                    color='white'
-                )
+    # Add data labels in the middle of segments larger than 10%, picked with one mask
+    category_idx, month_idx = np.nonzero(values.T > 10)
+    for i, j in zip(category_idx, month_idx):
+        ax.text(
+            j, bottoms[j, i] + values[j, i] / 2, f'{values[j, i]:.1f}%',
+            ha='center', va='center',
+            fontsize=9, fontweight='bold',
+            color='white'
+        )
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'monthly_category_proportion.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'monthly_category_proportion.png', dpi, formats)
 
     return monthly_category
\ No newline at end of file
@@ -4,38 +4,29 @@ Monthly comparison chart generation for the Cashflow Tracker
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import os
+from typing import Sequence
 from matplotlib.ticker import FuncFormatter
 from core.schema import TransactionSchema
-from .constants import money_formatter
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, TITLE_STYLE, money_formatter, save_chart
 
 
-def generate_monthly_comparison_chart(transaction_data: pd.DataFrame, output_dir: str = '.') -> pd.DataFrame:
+def generate_monthly_comparison_chart(transaction_data: pd.DataFrame, output_dir: str = '.',
+                                      dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.DataFrame:
     """
     Generate a bar chart showing monthly income vs expenses
 
     Args:
         transaction_data: DataFrame with transaction data
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         DataFrame with monthly pivot data
     """
-    # Aggregate by month and type
-    monthly_data = transaction_data.groupby(['Month', TransactionSchema.TYPE])[
-        TransactionSchema.AMOUNT].sum().reset_index()
-
-    # Pivot the data for easier plotting
-    monthly_pivot = pd.pivot_table(
-        monthly_data,
-        index='Month',
-        columns=TransactionSchema.TYPE,
-        values=TransactionSchema.AMOUNT,
-        aggfunc='sum'
-    ).fillna(0)
-
-    # Sort by month
-    monthly_pivot = monthly_pivot.sort_index()
+    # Aggregate by month and type, with types as columns sorted by month
+    monthly_pivot = transaction_data.groupby(['Month', TransactionSchema.TYPE], observed=True)[
+        TransactionSchema.AMOUNT].sum().unstack(fill_value=0).sort_index()
 
     # Create figure with professional styling
     fig, ax = plt.subplots(figsize=(12, 6), facecolor='white')
@@ -51,9 +42,9 @@ def generate_monthly_comparison_chart(transaction_data: pd.DataFrame, output_dir
     )
 
     # Add title and labels with proper styling
-    ax.set_title('Monthly Income vs Expenses', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Month', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Amount', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Monthly Income vs Expenses', **TITLE_STYLE)
+    ax.set_xlabel('Month', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Amount', **AXIS_LABEL_STYLE)
 
     # Format y-axis as currency
     ax.yaxis.set_major_formatter(FuncFormatter(money_formatter))
@@ -77,7 +68,6 @@ def generate_monthly_comparison_chart(transaction_data: pd.DataFrame, output_dir
         ax.bar_label(container, fmt='${:.0f}', fontsize=8, padding=3)
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'monthly_comparison_bar.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'monthly_comparison_bar.png', dpi, formats)
 
     return monthly_pivot
\ No newline at end of file
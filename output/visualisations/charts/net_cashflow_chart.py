@@ -4,19 +4,21 @@ Net cashflow chart generation for the Cashflow Tracker
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import os
+from typing import Sequence
 from matplotlib.ticker import FuncFormatter
-from core.schema import TransactionSchema
-from .constants import money_formatter
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, LABEL_BBOX, TITLE_STYLE, money_formatter, save_chart
 
 
-def generate_net_cashflow_chart(monthly_pivot: pd.DataFrame, output_dir: str = '.') -> pd.DataFrame:
+def generate_net_cashflow_chart(monthly_pivot: pd.DataFrame, output_dir: str = '.',
+                                dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.DataFrame:
     """
     Generate a line chart showing net cashflow over time
 
     Args:
         monthly_pivot: DataFrame with monthly income/expense data
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         DataFrame with net cashflow data
@@ -47,9 +49,9 @@ def generate_net_cashflow_chart(monthly_pivot: pd.DataFrame, output_dir: str = '
     ax.axhline(y=0, color='#c44e52', linestyle='-', alpha=0.3, linewidth=1.5)
 
     # Add title and labels with proper styling
-    ax.set_title('Net Cashflow Analysis', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Month', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Net Cashflow', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Net Cashflow Analysis', **TITLE_STYLE)
+    ax.set_xlabel('Month', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Net Cashflow', **AXIS_LABEL_STYLE)
 
     # Format y-axis as currency
     ax.yaxis.set_major_formatter(FuncFormatter(money_formatter))
@@ -66,7 +68,7 @@ def generate_net_cashflow_chart(monthly_pivot: pd.DataFrame, output_dir: str = '
             textcoords='offset points',
             ha='center',
             fontsize=8,
-            bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='lightgray', alpha=0.7)
+            bbox=LABEL_BBOX
         )
 
     # Highlight positive and negative areas
@@ -98,7 +100,6 @@ def generate_net_cashflow_chart(monthly_pivot: pd.DataFrame, output_dir: str = '
     ax.legend(frameon=True, framealpha=0.9, edgecolor='lightgray')
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'net_cashflow_line.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'net_cashflow_line.png', dpi, formats)
 
     return net_cashflow
\ No newline at end of file
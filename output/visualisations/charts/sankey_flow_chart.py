@@ -2,22 +2,23 @@
 Sankey diagram chart generation for the Cashflow Tracker
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import os
+from typing import Sequence
 from core.schema import TransactionSchema
-from .constants import PROFESSIONAL_COLORS
 import plotly.graph_objects as go
 import plotly.io as pio
 
-def generate_sankey_flow_diagram(transaction_data: pd.DataFrame, output_dir: str = '.') -> dict:
+def generate_sankey_flow_diagram(transaction_data: pd.DataFrame, output_dir: str = '.',
+                                 formats: Sequence[str] = ('png',)) -> dict:
     """
     Generate a Sankey diagram showing the flow of money from income categories to expense categories.
 
     Args:
         transaction_data: DataFrame with transaction data
         output_dir: Directory to save images
+        formats: Static file formats to save the diagram in, e.g. ('png', 'svg')
 
     Returns:
         Dictionary with flow data
@@ -28,8 +29,8 @@ def generate_sankey_flow_diagram(transaction_data: pd.DataFrame, output_dir: str
     expense_data = transaction_data[transaction_data[TransactionSchema.TYPE] == 'Expense']
 
     # Aggregate by category
-    income_by_category = income_data.groupby(TransactionSchema.CATEGORY)[TransactionSchema.AMOUNT].sum()
-    expense_by_category = expense_data.groupby(TransactionSchema.CATEGORY)[TransactionSchema.AMOUNT].sum()
+    income_by_category = income_data.groupby(TransactionSchema.CATEGORY, observed=True)[TransactionSchema.AMOUNT].sum()
+    expense_by_category = expense_data.groupby(TransactionSchema.CATEGORY, observed=True)[TransactionSchema.AMOUNT].sum()
 
     # Create nodes
     nodes = []
@@ -49,26 +50,20 @@ def generate_sankey_flow_diagram(transaction_data: pd.DataFrame, output_dir: str
         nodes.append(f"Expense: {category}")
         node_colors.append('#c44e52')  # Red for expense
 
-    # Create links from income categories to total income
-    source = []
-    target = []
-    value = []
+    # Link every income category to Total Income, then Total Income to every expense category
+    n_income, n_expense = len(income_by_category), len(expense_by_category)
+    total_income_idx = n_income
+    source = np.empty(n_income + n_expense, dtype=np.int64)
+    target = np.empty(n_income + n_expense, dtype=np.int64)
+    value = np.empty(n_income + n_expense, dtype=np.float64)
 
-    # Index of "Total Income" node
-    total_income_idx = len(income_by_category)
-
-    # Links from income categories to total income
-    for i, (category, amount) in enumerate(income_by_category.items()):
-        source.append(i)  # Income category node
-        target.append(total_income_idx)  # Total income node
-        value.append(amount)
-
-    # Links from total income to expense categories
-    for i, (category, amount) in enumerate(expense_by_category.items()):
-        source.append(total_income_idx)  # Total income node
-        target.append(total_income_idx + 1 + i)  # Expense category node
-        value.append(amount)
+    source[:n_income] = np.arange(n_income)
+    target[:n_income] = total_income_idx
+    value[:n_income] = income_by_category.to_numpy(dtype=np.float64)
 
+    source[n_income:] = total_income_idx
+    target[n_income:] = total_income_idx + 1 + np.arange(n_expense)
+    value[n_income:] = expense_by_category.to_numpy(dtype=np.float64)
 
     # Create links with color
     link_colors = ['rgba(85, 168, 104, 0.5)' for _ in range(len(income_by_category))] + \
@@ -99,9 +94,10 @@ def generate_sankey_flow_diagram(transaction_data: pd.DataFrame, output_dir: str
         height=800
     )
 
-    # Save as HTML (interactive) and as PNG (static)
+    # Save as HTML (interactive) and in each static format
     pio.write_html(fig, os.path.join(output_dir, 'cashflow_sankey.html'))
-    pio.write_image(fig, os.path.join(output_dir, 'cashflow_sankey.png'))
+    for file_format in formats:
+        pio.write_image(fig, os.path.join(output_dir, f'cashflow_sankey.{file_format}'))
 
     # Return flow data
     return {
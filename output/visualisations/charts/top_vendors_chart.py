@@ -4,13 +4,14 @@ Top vendors chart generation for the Cashflow Tracker
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import os
+from typing import Sequence
 from matplotlib.ticker import FuncFormatter
 from core.schema import TransactionSchema
-from .constants import money_formatter, PROFESSIONAL_COLORS
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, TITLE_STYLE, chart_colors, group_totals, money_formatter, save_chart
 
 
-def generate_top_vendors_chart(expense_data: pd.DataFrame, output_dir: str = '.', top_n: int = 10) -> pd.Series:
+def generate_top_vendors_chart(expense_data: pd.DataFrame, output_dir: str = '.', top_n: int = 10,
+                               dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.Series:
     """
     Generate a horizontal bar chart showing top vendors by spending
 
@@ -18,13 +19,14 @@ def generate_top_vendors_chart(expense_data: pd.DataFrame, output_dir: str = '.'
         expense_data: DataFrame with expense data
         output_dir: Directory to save images
         top_n: Number of top vendors to show
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         Series containing top vendor data
     """
     # Calculate totals by producer
-    producer_totals = expense_data.groupby(TransactionSchema.PRODUCER)[
-        TransactionSchema.AMOUNT].sum().sort_values(ascending=False)
+    producer_totals = group_totals(expense_data, TransactionSchema.PRODUCER).sort_values(ascending=False)
 
     # Get top N producers
     top_producers = producer_totals.head(top_n)
@@ -35,16 +37,16 @@ def generate_top_vendors_chart(expense_data: pd.DataFrame, output_dir: str = '.'
     bars = ax.barh(
         top_producers.index[::-1],  # Reverse for descending order
         top_producers.values[::-1],
-        color=PROFESSIONAL_COLORS[:len(top_producers)],
+        color=chart_colors(len(top_producers)),
         height=0.7,
         edgecolor='white',
         linewidth=0.7
     )
 
     # Add title and labels with proper styling
-    ax.set_title('Top Vendors by Expenditure', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Total Amount', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Vendor', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Top Vendors by Expenditure', **TITLE_STYLE)
+    ax.set_xlabel('Total Amount', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Vendor', **AXIS_LABEL_STYLE)
 
     # Format x-axis as currency
     ax.xaxis.set_major_formatter(FuncFormatter(money_formatter))
@@ -68,7 +70,6 @@ def generate_top_vendors_chart(expense_data: pd.DataFrame, output_dir: str = '.'
         )
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'top_producers_bar.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'top_producers_bar.png', dpi, formats)
 
     return top_producers
\ No newline at end of file
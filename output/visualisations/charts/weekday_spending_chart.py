@@ -4,41 +4,43 @@ Weekday spending chart generation for the Cashflow Tracker
 
 import matplotlib.pyplot as plt
 import pandas as pd
-import os
+from typing import Sequence
 from matplotlib.ticker import FuncFormatter
 from core.schema import TransactionSchema
-from .constants import money_formatter, PROFESSIONAL_COLORS
+from .constants import AXIS_LABEL_STYLE, DEFAULT_DPI, TITLE_STYLE, WEEKDAYS, chart_colors, money_formatter, save_chart
 
 
-def generate_weekday_spending_chart(expense_data: pd.DataFrame, output_dir: str = '.') -> pd.Series:
+def generate_weekday_spending_chart(expense_data: pd.DataFrame, output_dir: str = '.',
+                                    dpi: int = DEFAULT_DPI, formats: Sequence[str] = ('png',)) -> pd.Series:
     """
     Generate a bar chart showing spending by day of week
 
     Args:
         expense_data: DataFrame with expense data
         output_dir: Directory to save images
+        dpi: Resolution of the saved image
+        formats: File formats to save the chart in, e.g. ('png', 'svg')
 
     Returns:
         Series containing weekday spending data
     """
     # Ensure expense_data has the 'Weekday' column
     if 'Weekday' not in expense_data.columns:
-        expense_data = expense_data.copy()
-        expense_data['Weekday'] = pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.day_name()
+        expense_data = expense_data.assign(
+            Weekday=pd.to_datetime(expense_data[TransactionSchema.DATE]).dt.day_name())
 
     # Aggregate by day of week
-    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    weekday_spending = expense_data.groupby('Weekday')[TransactionSchema.AMOUNT].sum()
-    weekday_spending = weekday_spending.reindex(weekday_order)
+    weekday_spending = expense_data.groupby('Weekday', observed=True)[TransactionSchema.AMOUNT].sum()
+    weekday_spending = weekday_spending.reindex(WEEKDAYS)
 
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 6), facecolor='white')
 
     # Create bar chart with improved styling
     bars = ax.bar(
-        weekday_order,
+        WEEKDAYS,
         weekday_spending,
-        color=PROFESSIONAL_COLORS[:7],
+        color=chart_colors(7),
         width=0.7,
         edgecolor='white',
         linewidth=1
@@ -46,7 +48,7 @@ def generate_weekday_spending_chart(expense_data: pd.DataFrame, output_dir: str
 
     # Add a curved line connecting the tops of bars
     ax.plot(
-        weekday_order,
+        WEEKDAYS,
         weekday_spending,
         color='#4c72b0',
         linewidth=2,
@@ -59,9 +61,9 @@ def generate_weekday_spending_chart(expense_data: pd.DataFrame, output_dir: str
     )
 
     # Add title and labels with proper styling
-    ax.set_title('Weekly Expenditure Pattern Analysis', fontweight='bold', fontsize=14, pad=15)
-    ax.set_xlabel('Day of Week', fontweight='bold', fontsize=12, labelpad=10)
-    ax.set_ylabel('Total Expenditure', fontweight='bold', fontsize=12, labelpad=10)
+    ax.set_title('Weekly Expenditure Pattern Analysis', **TITLE_STYLE)
+    ax.set_xlabel('Day of Week', **AXIS_LABEL_STYLE)
+    ax.set_ylabel('Total Expenditure', **AXIS_LABEL_STYLE)
 
     # Format y-axis as currency
     ax.yaxis.set_major_formatter(FuncFormatter(money_formatter))
@@ -82,7 +84,7 @@ def generate_weekday_spending_chart(expense_data: pd.DataFrame, output_dir: str
     ax.grid(axis='y', linestyle='--', alpha=0.3)
 
     # Highlight weekends with background shading
-    weekend_indices = [weekday_order.index('Saturday'), weekday_order.index('Sunday')]
+    weekend_indices = [WEEKDAYS.index('Saturday'), WEEKDAYS.index('Sunday')]
     for idx in weekend_indices:
         ax.axvspan(
             idx - 0.4,
@@ -91,7 +93,6 @@ def generate_weekday_spending_chart(expense_data: pd.DataFrame, output_dir: str
         )
 
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'spending_by_weekday.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_chart(output_dir, 'spending_by_weekday.png', dpi, formats)
 
     return weekday_spending
\ No newline at end of file
@@ -48,7 +48,7 @@ setup(
     include_package_data=True,
     python_requires=">=3.8",
     install_requires=[
-        "pandas>=1.3.0",
+        "pandas>=2.0",
         "openpyxl>=3.0.0",
         "matplotlib>=3.4.0",
         "seaborn>=0.11.0",
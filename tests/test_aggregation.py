@@ -13,7 +13,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 from core.aggregation import (
     aggregate_by_type, aggregate_by_category,
     aggregate_by_producer, aggregate_by_month,
-    aggregate_by_payment_method, aggregate_by_subcategory
+    aggregate_by_payment_method, aggregate_by_subcategory,
+    aggregate_all
 )
 from core.schema import TransactionSchema
 
@@ -166,6 +167,15 @@ class TestAggregation(unittest.TestCase):
                              (result[TransactionSchema.SUBCATEGORY] == 'Restaurants')]
         self.assertEqual(restaurants[TransactionSchema.AMOUNT].iloc[0], 75.0)
 
+    def test_aggregate_all(self):
+        """Test single-pass aggregation matches the individual aggregations"""
+        result = aggregate_all(self.test_data)
+
+        self.assertEqual(result['type'], aggregate_by_type(self.test_data))
+        pd.testing.assert_frame_equal(result['category'], aggregate_by_category(self.test_data))
+        pd.testing.assert_frame_equal(result['producer'], aggregate_by_producer(self.test_data))
+        pd.testing.assert_frame_equal(result['month'], aggregate_by_month(self.test_data))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,6 +3,7 @@ Unit tests for financial calculation functions
 """
 
 import unittest
+import numpy as np
 import pandas as pd
 import sys
 from pathlib import Path
@@ -12,7 +13,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from core.calculation import (
     calculate_net_cashflow, calculate_cash_allocation,
-    calculate_budget_comparison, calculate_savings_rate
+    calculate_budget_comparison, calculate_savings_rate,
+    calculate_savings_rate_bulk, calculate_monthly_growth_rate
 )
 from core.schema import TransactionSchema, CategorySchema
 
@@ -111,6 +113,40 @@ class TestCalculation(unittest.TestCase):
         result_zero = calculate_savings_rate(0, 100)
         self.assertEqual(result_zero, 0)
 
+    def test_calculate_savings_rate_bulk(self):
+        """Test vectorized savings rate matches the scalar version"""
+        income = np.array([2000.0, 0.0, 1500.0, -50.0])
+        expenses = np.array([800.0, 100.0, 1800.0, 10.0])
+
+        result = calculate_savings_rate_bulk(income, expenses)
+        expected = [calculate_savings_rate(i, e) for i, e in zip(income, expenses)]
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_calculate_monthly_growth_rate(self):
+        """Test growth rates over the most recent months, with string or datetime dates"""
+        monthly_data = pd.DataFrame({
+            TransactionSchema.DATE: ['2025-01-05', '2025-02-05', '2025-03-05', '2025-04-05',
+                                     '2025-02-10', '2025-04-10'],
+            TransactionSchema.AMOUNT: [500.0, 1000.0, 1200.0, 1500.0, 400.0, 600.0],
+            TransactionSchema.TYPE: ['Income', 'Income', 'Income', 'Income', 'Expense', 'Expense']
+        })
+
+        # Only February to April count, so income grows from 1000 to 1500
+        result = calculate_monthly_growth_rate(monthly_data, months=3)
+        self.assertAlmostEqual(result['Income Growth'], 50.0)
+        self.assertAlmostEqual(result['Expense Growth'], 50.0)
+
+        # Parsed dates give the same result as strings
+        parsed = monthly_data.assign(**{
+            TransactionSchema.DATE: pd.to_datetime(monthly_data[TransactionSchema.DATE])
+        })
+        self.assertEqual(calculate_monthly_growth_rate(parsed, months=3), result)
+
+        # A single month has no growth
+        result_single = calculate_monthly_growth_rate(monthly_data, months=1)
+        self.assertEqual(result_single, {'Income Growth': 0, 'Expense Growth': 0})
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
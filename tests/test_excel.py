@@ -14,6 +14,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.schema import TransactionSchema, CategorySchema
+from core.calculation import calculate_budget_comparison
 from output.excel import (
     create_excel_workbook, populate_transaction_sheet,
     populate_category_sheet, populate_summary_sheet,
@@ -179,6 +180,26 @@ class TestExcel(unittest.TestCase):
         self.assertEqual(ws['A5'].value, "Net Cashflow:")
         self.assertEqual(ws['B5'].value, 1800.0)  # 3000 - 1200
 
+    def test_populate_summary_sheet_with_budget(self):
+        """Test summary sheet population with a budget comparison"""
+        budget_comparison = calculate_budget_comparison(self.category_summary, self.category_data)
+
+        wb = create_excel_workbook()
+        populate_summary_sheet(
+            wb,
+            self.type_summary,
+            self.category_summary,
+            self.cash_allocation,
+            budget_comparison
+        )
+        wb.save(self.excel_filename)
+
+        ws = load_workbook(self.excel_filename)["Summary"]
+        rows = list(ws.iter_rows(values_only=True))
+        header_index = rows.index(("Category", "Actual", "Budget", "% Used", "Difference"))
+
+        self.assertEqual(rows[header_index + 1], ("Housing", 1200.0, 1500.0, 0.8, 300.0))
+
     def test_create_charts(self):
         """Test chart creation"""
         wb = create_excel_workbook()
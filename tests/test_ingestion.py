@@ -13,9 +13,10 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.ingestion import (
-    ingest_csv, ingest_excel, create_manual_transaction
+    ingest_csv, ingest_excel, create_manual_transaction, export_csv, HAS_PYARROW
 )
 from core.schema import TransactionSchema
+from core.processing import clean_transaction_data
 
 
 class TestIngestion(unittest.TestCase):
@@ -63,6 +64,36 @@ class TestIngestion(unittest.TestCase):
         self.assertEqual(df['Amount'].iloc[0], 1000.0)
         self.assertEqual(df['Type'].iloc[1], 'Expense')
 
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_ingest_csv_arrow_matches_default(self):
+        """Test that the PyArrow CSV path returns the same data as the default parser"""
+        arrow_df = ingest_csv(self.csv_filename, use_arrow=True)
+        default_df = ingest_csv(self.csv_filename, use_arrow=False)
+
+        pd.testing.assert_frame_equal(arrow_df, default_df)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_ingest_csv_arrow_keeps_dates_as_text(self):
+        """Test that date-like columns other than Date are also read as text by the PyArrow path"""
+        self.test_data.assign(**{
+            'Transaction Date': ['2025-04-02', '2025-04-03'],
+            'Posted': ['2025-04-02 10:00:00', '2025-04-03 11:30:00']
+        }).to_csv(self.csv_filename, index=False)
+
+        arrow_df = ingest_csv(self.csv_filename, use_arrow=True)
+
+        pd.testing.assert_frame_equal(arrow_df, ingest_csv(self.csv_filename, use_arrow=False))
+        self.assertEqual(arrow_df['Transaction Date'].iloc[0], '2025-04-02')
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_export_csv_arrow_round_trip(self):
+        """Test that a CSV written by PyArrow reads back to the same transactions"""
+        expected = clean_transaction_data(self.test_data)
+        export_csv(expected, self.csv_filename, use_arrow=True)
+        actual = clean_transaction_data(ingest_csv(self.csv_filename))
+
+        pd.testing.assert_frame_equal(actual, expected)
+
     def test_ingest_excel(self):
         """Test Excel ingestion"""
         df = ingest_excel(self.excel_filename)
@@ -76,6 +107,36 @@ class TestIngestion(unittest.TestCase):
         self.assertEqual(df['Amount'].iloc[0], 1000.0)
         self.assertEqual(df['Type'].iloc[1], 'Expense')
 
+    def test_ingest_excel_duplicate_headers(self):
+        """Test that repeated headers are renamed like read_excel does"""
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        wb.active.append(['Date', 'Amount', 'Amount', 'Amount.1', 'Amount'])
+        wb.active.append(['2025-04-01', 1.0, 2.0, 3.0, 4.0])
+        wb.save(self.excel_filename)
+
+        df = ingest_excel(self.excel_filename)
+
+        self.assertEqual(list(df.columns), list(pd.read_excel(self.excel_filename).columns))
+        self.assertEqual(list(df.columns), ['Date', 'Amount', 'Amount.2', 'Amount.1', 'Amount.3'])
+        self.assertEqual(df['Amount.2'].iloc[0], 2)
+
+    def test_ingest_excel_blank_rows(self):
+        """Test that blank rows inside the sheet are kept and trailing ones dropped, like read_excel"""
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        for row in (['Date', 'Amount'], ['2025-04-01', 1.0], [None, None], ['2025-04-03', 3.0], [None, None]):
+            wb.active.append(row)
+        wb.save(self.excel_filename)
+
+        df = ingest_excel(self.excel_filename)
+
+        pd.testing.assert_frame_equal(df, pd.read_excel(self.excel_filename))
+        self.assertEqual(len(df), 3)
+        self.assertTrue(df.iloc[1].isna().all())
+
     def test_create_manual_transaction(self):
         """Test manual transaction creation"""
         transaction = create_manual_transaction(
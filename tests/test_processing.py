@@ -3,6 +3,7 @@ Unit tests for data processing functions
 """
 
 import unittest
+import numpy as np
 import pandas as pd
 import sys
 from pathlib import Path
@@ -63,26 +64,70 @@ class TestProcessing(unittest.TestCase):
         self.assertEqual(df[TransactionSchema.AMOUNT].iloc[1], 50.0)
         self.assertEqual(df[TransactionSchema.AMOUNT].iloc[2], 15.99)
 
+        # Check that grouping columns are stored as categoricals
+        self.assertIsInstance(df[TransactionSchema.TYPE].dtype, pd.CategoricalDtype)
+        self.assertIn('Income', df[TransactionSchema.TYPE].cat.categories)
+        self.assertIn('Expense', df[TransactionSchema.TYPE].cat.categories)
+
+    def test_clean_transaction_data_categorical_columns(self):
+        """Test that new labels have to be added to a cleaned column's categories"""
+        df = clean_transaction_data(self.test_data)
+
+        with self.assertRaises(TypeError):
+            df.loc[0, TransactionSchema.CATEGORY] = 'Bonus'
+
+        df[TransactionSchema.CATEGORY] = df[TransactionSchema.CATEGORY].cat.add_categories(['Bonus'])
+        df.loc[0, TransactionSchema.CATEGORY] = 'Bonus'
+        self.assertEqual(df[TransactionSchema.CATEGORY].iloc[0], 'Bonus')
+
+        df[TransactionSchema.PRODUCER] = df[TransactionSchema.PRODUCER].astype(str)
+        df.loc[0, TransactionSchema.PRODUCER] = 'Acme'
+        self.assertEqual(df[TransactionSchema.PRODUCER].iloc[0], 'Acme')
+
+    def test_clean_transaction_data_date_format(self):
+        """Test date parsing with detected and explicit formats"""
+        us_dates = self.test_data.assign(Date=['04/01/2025', '04/02/2025', '12/03/2025'])
+        df = clean_transaction_data(us_dates)
+        self.assertEqual(df[TransactionSchema.DATE].iloc[2], pd.Timestamp('2025-12-03'))
+
+        eu_dates = self.test_data.assign(Date=['01/04/2025', '02/04/2025', '03/12/2025'])
+        df = clean_transaction_data(eu_dates, date_format='%d/%m/%Y')
+        self.assertEqual(df[TransactionSchema.DATE].iloc[2], pd.Timestamp('2025-12-03'))
+
+    def test_clean_transaction_data_float32(self):
+        """Test opt-in float32 amounts and the precision guard"""
+        df = clean_transaction_data(self.test_data, precision='float32')
+        self.assertEqual(df[TransactionSchema.AMOUNT].dtype, np.float32)
+        self.assertAlmostEqual(float(df[TransactionSchema.AMOUNT].iloc[2]), 15.99, places=5)
+
+        large = self.test_data.assign(Amount=[1000.0, -50.0, 250000.0])
+        with self.assertRaises(ValueError):
+            clean_transaction_data(large, precision='float32')
+
     def test_categorize_transaction(self):
         """Test transaction categorization"""
         # Clean the data first
         df = clean_transaction_data(self.test_data)
 
         # Test each transaction
-        categorized_transaction1 = categorize_transaction(
-            df.iloc[0], self.category_rules
-        )
-        self.assertEqual(categorized_transaction1[TransactionSchema.CATEGORY], 'Income')
-
-        categorized_transaction2 = categorize_transaction(
-            df.iloc[1], self.category_rules
+        for i, expected in enumerate(['Income', 'Food', 'Entertainment']):
+            row = df.iloc[i]
+            category = categorize_transaction(
+                row[TransactionSchema.DESCRIPTION], row[TransactionSchema.TYPE],
+                row[TransactionSchema.PRODUCER], self.category_rules
+            )
+            self.assertEqual(category, expected)
+
+        # Producer map takes precedence over keyword rules
+        category = categorize_transaction(
+            'Groceries at Walmart', 'Expense', 'Walmart', self.category_rules,
+            producer_category_map={'Walmart': 'Shopping'}
         )
-        self.assertEqual(categorized_transaction2[TransactionSchema.CATEGORY], 'Food')
+        self.assertEqual(category, 'Shopping')
 
-        categorized_transaction3 = categorize_transaction(
-            df.iloc[2], self.category_rules
-        )
-        self.assertEqual(categorized_transaction3[TransactionSchema.CATEGORY], 'Entertainment')
+        # Unmatched transactions fall back to a default based on type
+        self.assertEqual(categorize_transaction('Misc', 'Income', None, self.category_rules), 'Income')
+        self.assertEqual(categorize_transaction('Misc', 'Expense', None, self.category_rules), 'Miscellaneous')
 
     def test_categorize_all_transactions(self):
         """Test transaction categorization for all rows"""
@@ -125,6 +170,54 @@ class TestProcessing(unittest.TestCase):
         self.assertEqual(df_with_producers[TransactionSchema.PRODUCER].iloc[1], 'Walmart')
         self.assertEqual(df_with_producers[TransactionSchema.PRODUCER].iloc[2], 'Netflix')
 
+        # Check that producers stay categorical, as clean_transaction_data stores them
+        self.assertIsInstance(df_with_producers[TransactionSchema.PRODUCER].dtype, pd.CategoricalDtype)
+
+    def _extract_producers(self, descriptions, producer_patterns):
+        """Run extract_all_producers on bare descriptions and return the producers"""
+        df = pd.DataFrame({
+            TransactionSchema.DESCRIPTION: descriptions,
+            TransactionSchema.PRODUCER: [None] * len(descriptions)
+        })
+        return extract_all_producers(df, producer_patterns)[TransactionSchema.PRODUCER].tolist()
+
+    def test_extract_all_producers_newlines(self):
+        """Test that '.' in a pattern does not match newlines, but matches on later lines are found"""
+        producers = self._extract_producers(
+            ['foo gas\nstation', 'card payment\nat gas station'],
+            {r'gas.station': 'Gas Station'}
+        )
+        self.assertEqual(producers, ['foo', 'Gas Station'])
+
+    def test_extract_all_producers_backreference(self):
+        """Test patterns with their own groups and backreferences"""
+        producers = self._extract_producers(
+            ['abcabc store', 'abc store', 'Walmart'],
+            {r'(abc)\1': 'Repeat', r'walmart': 'Walmart'}
+        )
+        self.assertEqual(producers, ['Repeat', 'abc', 'Walmart'])
+
+    def test_extract_all_producers_inline_flags(self):
+        """Test patterns with inline global flags"""
+        producers = self._extract_producers(
+            ['Zed Shop', 'Other Shop'],
+            {r'(?i)zed': 'Zed', r'other': 'Other'}
+        )
+        self.assertEqual(producers, ['Zed', 'Other'])
+
+    def test_extract_all_producers_matches_extract_producer(self):
+        """Test that the first matching pattern wins, as with extract_producer"""
+        patterns = {r'market': 'Market', r'walmart': 'Walmart', r'net.lix': 'Netflix'}
+        descriptions = ['Walmart Supermarket', 'net\nlix', 'Netflix', 'Unknown Vendor']
+
+        producers = self._extract_producers(descriptions, patterns)
+        expected = [
+            extract_producer(pd.Series({TransactionSchema.DESCRIPTION: description,
+                                        TransactionSchema.PRODUCER: None}), patterns)[TransactionSchema.PRODUCER]
+            for description in descriptions
+        ]
+        self.assertEqual(producers, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Unit tests for chart generation functions
+"""
+
+import json
+import unittest
+import pandas as pd
+import tempfile
+import sys
+from pathlib import Path
+from PIL import Image
+
+# Add parent directory to path to import package
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.schema import TransactionSchema, CategorySchema
+from output.visualisations.charts.budget_comparison_chart import generate_budget_comparison_chart
+from output.visualisations.charts.category_spending_chart import generate_spending_by_category_chart
+from output.visualisations.charts.constants import DEFAULT_DPI
+from output.visualisations.charts.manager import create_visualisations
+
+
+class TestVisualisations(unittest.TestCase):
+    """Test chart generation functions"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.output_dir = tempfile.TemporaryDirectory()
+
+        self.expense_data = pd.DataFrame({
+            TransactionSchema.DATE: pd.to_datetime(['2025-04-01', '2025-04-10', '2025-04-15']),
+            TransactionSchema.AMOUNT: [1200.0, 150.0, 250.0],
+            TransactionSchema.TYPE: ['Expense', 'Expense', 'Expense'],
+            TransactionSchema.CATEGORY: ['Housing', 'Food', 'Food'],
+            TransactionSchema.PRODUCER: ['Landlord', 'Grocery', 'Restaurant']
+        })
+
+    def tearDown(self):
+        """Remove the chart output directory"""
+        self.output_dir.cleanup()
+
+    def test_budget_comparison_totals_subcategory_budgets(self):
+        """Test that budgets with one row per subcategory are summed per main category"""
+        budget_data = pd.DataFrame({
+            CategorySchema.MAIN_CATEGORY: ['Housing', 'Food', 'Food', 'Travel'],
+            CategorySchema.SUBCATEGORY: ['Rent', 'Groceries', 'Dining Out', 'Flights'],
+            CategorySchema.BUDGET: [1500, 300, 200, 100]
+        })
+
+        result = generate_budget_comparison_chart(self.expense_data, budget_data, self.output_dir.name)
+        result = result.set_index(TransactionSchema.CATEGORY)
+
+        self.assertEqual(sorted(result.index), ['Food', 'Housing'])
+        self.assertEqual(result.loc['Food', 'Budget Amount'], 500)
+        self.assertEqual(result.loc['Food', TransactionSchema.AMOUNT], 400.0)
+        self.assertEqual(result.loc['Housing', 'Budget Amount'], 1500)
+        self.assertTrue((Path(self.output_dir.name) / 'budget_vs_actual.png').exists())
+
+    def test_budget_comparison_drops_empty_budgets(self):
+        """Test that a category whose budget rows are all empty is left out"""
+        budget_data = pd.DataFrame({
+            CategorySchema.MAIN_CATEGORY: ['Housing', 'Food', 'Food'],
+            CategorySchema.SUBCATEGORY: ['Rent', 'Groceries', 'Dining Out'],
+            CategorySchema.BUDGET: [1500, None, None]
+        })
+
+        result = generate_budget_comparison_chart(self.expense_data, budget_data, self.output_dir.name)
+
+        self.assertEqual(result[TransactionSchema.CATEGORY].tolist(), ['Housing'])
+
+    def test_chart_save_options(self):
+        """Test that directly generated charts default to DEFAULT_DPI PNGs and options do not carry over"""
+        output = Path(self.output_dir.name)
+
+        generate_spending_by_category_chart(self.expense_data, self.output_dir.name, dpi=100, formats=('png', 'svg'))
+        self.assertTrue((output / 'category_spending_pie.svg').exists())
+        with Image.open(output / 'category_spending_pie.png') as image:
+            self.assertAlmostEqual(image.info['dpi'][0], 100, places=0)
+
+        (output / 'category_spending_pie.svg').unlink()
+        generate_spending_by_category_chart(self.expense_data, self.output_dir.name)
+        self.assertFalse((output / 'category_spending_pie.svg').exists())
+        with Image.open(output / 'category_spending_pie.png') as image:
+            self.assertAlmostEqual(image.info['dpi'][0], DEFAULT_DPI, places=0)
+
+    def _create_charts(self, transaction_data, formats=('png',)):
+        """Render a small set of charts with reuse enabled, in this process"""
+        return create_visualisations(transaction_data, self.output_dir.name,
+                                     chart_types=['category_spending', 'category_heatmap'],
+                                     max_workers=1, reuse_unchanged=True, formats=formats)
+
+    def test_reuse_unchanged_charts(self):
+        """Test that charts drawn from identical data are reused and changed data redraws them"""
+        self.assertIn('category_spending', self._create_charts(self.expense_data))
+        self.assertNotIn('category_spending', self._create_charts(self.expense_data))
+
+        changed = self.expense_data.assign(**{TransactionSchema.AMOUNT: [1200.0, 150.0, 300.0]})
+        self.assertIn('category_spending', self._create_charts(changed))
+
+    def test_reuse_checks_every_format(self):
+        """Test that a chart missing one of its formats is redrawn"""
+        output = Path(self.output_dir.name)
+
+        self._create_charts(self.expense_data, formats=('png', 'svg'))
+        (output / 'category_spending_pie.svg').unlink()
+
+        self.assertIn('category_spending', self._create_charts(self.expense_data, formats=('png', 'svg')))
+        self.assertTrue((output / 'category_spending_pie.svg').exists())
+
+    def test_reuse_ignores_charts_that_were_not_drawn(self):
+        """Test that a generator returning early does not mark an older image as up to date"""
+        output = Path(self.output_dir.name)
+        (output / 'category_month_stacked.png').write_bytes(b'stale')
+
+        # All expenses fall in one month, which is too little data for the stacked chart
+        self.assertIsNone(self._create_charts(self.expense_data)['category_heatmap'])
+        self.assertIn('category_heatmap', self._create_charts(self.expense_data))
+
+        with open(output / '.chart_cache.json') as f:
+            self.assertNotIn('category_heatmap', json.load(f))
+        self.assertEqual((output / 'category_month_stacked.png').read_bytes(), b'stale')
+
+    def test_net_cashflow_chart(self):
+        """Test that the net cashflow chart is drawn from monthly income and expense totals"""
+        transaction_data = pd.concat([self.expense_data, pd.DataFrame({
+            TransactionSchema.DATE: pd.to_datetime(['2025-04-01', '2025-05-01']),
+            TransactionSchema.AMOUNT: [3000.0, 1000.0],
+            TransactionSchema.TYPE: ['Income', 'Income'],
+            TransactionSchema.CATEGORY: ['Salary', 'Salary'],
+            TransactionSchema.PRODUCER: ['Employer', 'Employer']
+        })], ignore_index=True)
+
+        result = create_visualisations(transaction_data, self.output_dir.name,
+                                       chart_types=['net_cashflow'], max_workers=1)
+
+        self.assertEqual(result['net_cashflow']['Net'].tolist(), [1400.0, 1000.0])
+        self.assertTrue((Path(self.output_dir.name) / 'net_cashflow_line.png').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
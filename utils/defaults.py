@@ -5,7 +5,7 @@ Default values and generators for the Cashflow Tracker
 import pandas as pd
 import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List
 from core.schema import TransactionSchema, CategorySchema
 
 
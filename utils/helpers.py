@@ -2,11 +2,12 @@
 Helper functions for the Cashflow Tracker
 """
 
+import importlib
 import pandas as pd
 import os
 import re
-from typing import Dict, List, Optional, Union, Any
-from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Union, Any
+from datetime import datetime
 import calendar
 
 
@@ -17,8 +18,7 @@ def ensure_directory_exists(directory_path: str) -> None:
     Args:
         directory_path: Path to the directory
     """
-    if not os.path.exists(directory_path):
-        os.makedirs(directory_path)
+    os.makedirs(directory_path, exist_ok=True)
 
 
 def format_currency(value: Union[float, int]) -> str:
@@ -211,4 +211,25 @@ def deep_get(dictionary: Dict[str, Any], keys: List[str], default: Any = None) -
             d = d[key]
         else:
             return default
-    return d
\ No newline at end of file
+    return d
+
+
+def lazy_module_getattr(namespace: Dict[str, Any], lazy_imports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ (PEP 562) that imports attributes on first access
+
+    Args:
+        namespace: globals() of the module the function is installed in
+        lazy_imports: Dict mapping attribute names to the module that defines them
+
+    Returns:
+        Function to assign to the module's __getattr__
+    """
+    def __getattr__(name: str) -> Any:
+        if name in lazy_imports:
+            value = getattr(importlib.import_module(lazy_imports[name]), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+
+    return __getattr__